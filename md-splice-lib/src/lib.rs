@@ -130,16 +130,18 @@ impl MarkdownDocument {
     /// The output preserves the original frontmatter delimiter style and renders the body
     /// with the library's default printer configuration (zero spaces before list markers).
     pub fn render(&self) -> String {
-        let mut output = String::new();
-
-        if let Some(prefix) = self.parsed.frontmatter_block.as_deref() {
-            output.push_str(prefix);
-        }
-
         let body_output = render_markdown(&self.doc, default_printer_config());
-        output.push_str(&body_output);
 
-        output
+        match self.parsed.frontmatter_block.as_deref() {
+            // No frontmatter: hand the printer's String back without copying.
+            None => body_output,
+            Some(prefix) => {
+                let mut output = String::with_capacity(prefix.len() + body_output.len());
+                output.push_str(prefix);
+                output.push_str(&body_output);
+                output
+            }
+        }
     }
 
     /// Provides read-only access to the Markdown AST blocks.
@@ -301,30 +301,31 @@ pub fn locate<'a>(
     }
 
     // --- Block Search Logic (default) ---
-    let matches: Vec<_> = (scope.block_start..scope.block_end)
-        .filter_map(|index| {
-            let block = blocks.get(index)?;
-            if block_matches_selector(block, selector) {
-                Some((index, block))
-            } else {
-                None
+    // Scan lazily: once the ordinal match is in hand and a second match has
+    // proven ambiguity, the rest of the document need not be walked at all.
+    let needed = ordinal_index + 1;
+    let mut found: Option<(usize, &Block)> = None;
+    let mut match_count = 0usize;
+
+    for index in scope.block_start..scope.block_end {
+        let Some(block) = blocks.get(index) else {
+            break;
+        };
+        if block_matches_selector(block, selector) {
+            match_count += 1;
+            if match_count == needed {
+                found = Some((index, block));
             }
-        })
-        .collect();
+            if match_count > 1 && found.is_some() {
+                break;
+            }
+        }
+    }
 
-    let is_ambiguous = matches.len() > 1;
-
-    matches
-        .get(ordinal_index)
-        .map(|(index, block)| {
-            (
-                FoundNode::Block {
-                    index: *index,
-                    block,
-                },
-                is_ambiguous,
-            )
-        })
+    let is_ambiguous = match_count > 1;
+
+    found
+        .map(|(index, block)| (FoundNode::Block { index, block }, is_ambiguous))
         .ok_or(SpliceError::NodeNotFound)
 }
 
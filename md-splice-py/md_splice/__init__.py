@@ -1,32 +1,13 @@
 """Python bindings for the md-splice Markdown editing toolkit.
 
 The package re-exports the native ``MarkdownDocument`` type, helper operations,
-and the rich exception hierarchy defined for the Rust core bindings.
+and the rich exception hierarchy defined for the Rust core bindings. Error
+classes and the :mod:`.types` dataclasses are resolved lazily via PEP 562 so
+importing the package for the common parse-and-render case does not build the
+full exception hierarchy or the six operation dataclasses.
 """
 
 from . import errors
-from .errors import (
-    AmbiguousContentSourceError,
-    AmbiguousStdinSourceError,
-    ConflictingScopeError,
-    FrontmatterKeyNotFoundError,
-    FrontmatterMissingError,
-    FrontmatterParseError,
-    FrontmatterSerializeError,
-    InvalidChildInsertionError,
-    InvalidListItemContentError,
-    InvalidRegexError,
-    InvalidSectionDeleteError,
-    IoError,
-    MarkdownParseError,
-    MdSpliceError,
-    NoContentError,
-    NodeNotFoundError,
-    OperationFailedError,
-    OperationParseError,
-    RangeRequiresBlockError,
-    SectionRequiresHeadingError,
-)
 from ._native import (
     MarkdownDocument,
     __version__,
@@ -34,24 +15,19 @@ from ._native import (
     dumps_operations,
     loads_operations,
 )
-from .types import (
-    DeleteFrontmatterOperation,
-    DeleteOperation,
-    FrontmatterFormat,
-    InsertOperation,
-    InsertPosition,
-    Operation,
-    ReplaceFrontmatterOperation,
-    ReplaceOperation,
-    Selector,
-    SetFrontmatterOperation,
-)
 
-__all__ = [
+_STATIC = (
     "MarkdownDocument",
     "diff_unified",
     "loads_operations",
     "dumps_operations",
+    "errors",
+    "__version__",
+)
+
+# Dataclasses and enums imported from .types on first access; dataclass
+# construction at import time is measurable and most callers never touch them.
+_TYPES_NAMES = (
     "InsertPosition",
     "Selector",
     "FrontmatterFormat",
@@ -62,32 +38,37 @@ __all__ = [
     "DeleteFrontmatterOperation",
     "ReplaceFrontmatterOperation",
     "Operation",
-    "errors",
-    "__version__",
-]
-
-__all__.extend(
-    [
-        "MdSpliceError",
-        "NodeNotFoundError",
-        "InvalidChildInsertionError",
-        "AmbiguousContentSourceError",
-        "NoContentError",
-        "InvalidListItemContentError",
-        "AmbiguousStdinSourceError",
-        "InvalidSectionDeleteError",
-        "SectionRequiresHeadingError",
-        "ConflictingScopeError",
-        "RangeRequiresBlockError",
-        "FrontmatterMissingError",
-        "FrontmatterKeyNotFoundError",
-        "FrontmatterParseError",
-        "FrontmatterSerializeError",
-        "MarkdownParseError",
-        "OperationParseError",
-        "OperationFailedError",
-        "IoError",
-        "InvalidRegexError",
-        "errors",
-    ]
+    "OP_TAGS",
 )
+_TYPES_EXPORTS = frozenset(_TYPES_NAMES)
+
+# Error classes are looked up on first access instead of being copied into
+# this namespace at import time.
+_LAZY_ERRORS = frozenset(errors.__all__)
+
+__all__ = [*_STATIC, *_TYPES_NAMES, *errors.__all__]
+
+
+def __getattr__(name: str) -> object:
+    if name in _TYPES_EXPORTS or name == "types":
+        # import_module avoids the fromlist getattr that `from . import types`
+        # performs, which would re-enter this hook before the submodule is
+        # bound. The import binds the submodule on the package, so subsequent
+        # ``md_splice.types`` access no longer routes through __getattr__.
+        from importlib import import_module
+
+        types = import_module(".types", __name__)
+        if name == "types":
+            return types
+        value = getattr(types, name)
+        globals()[name] = value
+        return value
+    if name in _LAZY_ERRORS:
+        value = getattr(errors, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
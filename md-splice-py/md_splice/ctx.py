@@ -10,32 +10,55 @@ manually for each edit session.
 from __future__ import annotations
 
 from contextlib import AbstractContextManager
-from dataclasses import dataclass
 from pathlib import Path
+import functools
 import os
-import typing as _t
+import re
+import sys
 import warnings
 
-from . import MarkdownDocument, diff_unified
+from . import MarkdownDocument
+from ._native import AmbiguityWarning, diff_unified_from_file
 from .errors import OperationFailedError
-from .types import Operation
+from .types import OP_TAGS, Operation
 
 __all__ = ["MdEdit", "MdBatchEdit"]
 
 
-# Known substring emitted by the native layer when ambiguity occurs.
-_AMBIGUITY_WARNING_SNIPPET = "matched multiple nodes"
+# Legacy pattern for ambiguity warnings emitted as plain UserWarning by older
+# native layers; current versions raise the dedicated AmbiguityWarning.
+_LEGACY_AMBIGUITY_RE = re.compile(r"matched multiple nodes")
 
-# Cache the concrete operation classes for runtime isinstance checks.
-_OPERATION_TYPES: tuple[type[object], ...] = _t.get_args(Operation)
+# Precompiled warnings-filter entries: ambiguity warnings are turned into
+# exceptions by the warnings machinery itself, so unrelated warnings never
+# enter a Python-level trampoline. The second entry covers older native
+# layers that emit plain UserWarning (message regexes match from the start).
+_AMBIGUITY_ERROR_FILTERS = (
+    ("error", None, AmbiguityWarning, None, 0),
+    ("error", re.compile(r".*matched multiple nodes"), UserWarning, None, 0),
+)
 
+# Descriptor-based loader; absent on platforms without POSIX fds.
+_FROM_FD = getattr(MarkdownDocument, "from_fd", None)
 
-@dataclass(slots=True)
-class _StaleToken:
-    """Stat snapshot captured when entering a context."""
 
-    mtime_ns: int
-    size: int
+def _is_ambiguity_exception(exc_type: type[BaseException], exc: BaseException) -> bool:
+    if issubclass(exc_type, AmbiguityWarning):
+        return True
+    return exc_type is UserWarning and bool(_LEGACY_AMBIGUITY_RE.search(str(exc)))
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_path(raw: str, cwd: str) -> Path:
+    """Resolve ``raw`` relative to ``cwd``, memoizing repeated lookups.
+
+    ``cwd`` participates in the cache key so relative paths resolved from
+    different working directories do not collide; absolute paths pass an
+    empty ``cwd`` so they share one entry regardless of working directory.
+    The cache lives for the process, so a symlink retargeted mid-process
+    keeps its original resolution for the active-path guard.
+    """
+    return Path(raw).expanduser().resolve()
 
 
 class MdEdit:
@@ -52,8 +75,8 @@ class MdEdit:
       message.
     * ``check_stale`` prevents writes when the file changed on disk since
       entry.
-    * ``preview_diff`` prints a unified diff via :func:`diff_unified` before
-      committing.
+    * ``preview_diff`` prints a unified diff computed by the native layer
+      before committing.
 
     Parameters mirror the specification and default to the safe choices used by
     the CLI.
@@ -74,8 +97,16 @@ class MdEdit:
         if path == "-":
             raise ValueError("stdin path '-' is not supported for MdEdit")
 
-        self._raw_path = Path(path).expanduser()
-        self._resolved_path = self._raw_path.resolve()
+        raw = Path(path)
+        if raw.is_absolute():
+            # resolve() still runs (memoized) so symlinked aliases of the
+            # same file collide in _active_paths; only the cwd lookup and
+            # per-cwd cache fragmentation are skipped.
+            self._raw_path = raw
+            self._resolved_path = _resolve_path(str(raw), "")
+        else:
+            self._raw_path = raw.expanduser()
+            self._resolved_path = _resolve_path(str(raw), os.getcwd())
         self._backup = backup
         self._fail_on_ambiguity = fail_on_ambiguity
         self._check_stale = check_stale
@@ -83,9 +114,15 @@ class MdEdit:
         self._commit = commit
 
         self._doc: MarkdownDocument | None = None
-        self._stale_token: _StaleToken | None = None
+        # Stat snapshot captured on entry, kept as flat ints so the stale
+        # check is a few LOAD_ATTR + int compares rather than a tuple
+        # comparison. The inode/device pair catches atomic-rename saves.
+        self._stale_size = -1
+        self._stale_mtime_ns = -1
+        self._stale_ino = -1
+        self._stale_dev = -1
         self._warnings_cm: AbstractContextManager[None] | None = None
-        self._previous_showwarning: _t.Callable[..., _t.Any] | None = None
+        self._ambiguity_installed = False
 
     # Public API ---------------------------------------------------------
     def __enter__(self) -> MarkdownDocument:
@@ -96,14 +133,29 @@ class MdEdit:
 
         self._active_paths.add(self._resolved_path)
         try:
-            stat_info = os.stat(self._resolved_path)
-            self._stale_token = _StaleToken(stat_info.st_mtime_ns, stat_info.st_size)
+            if _FROM_FD is not None:
+                fd = os.open(self._resolved_path, os.O_RDONLY)
+                try:
+                    stat_info = os.fstat(fd)
+                except OSError:
+                    os.close(fd)
+                    raise
+                # The native layer takes ownership of the descriptor.
+                doc = _FROM_FD(fd, path=str(self._raw_path))
+            else:  # pragma: no cover - non-POSIX fallback
+                stat_info = os.stat(self._resolved_path)
+                doc = MarkdownDocument.from_file(str(self._raw_path))
+
+            self._stale_size = stat_info.st_size
+            self._stale_mtime_ns = stat_info.st_mtime_ns
+            self._stale_ino = stat_info.st_ino
+            self._stale_dev = stat_info.st_dev
 
             if self._fail_on_ambiguity:
                 self._install_ambiguity_filter()
 
-            self._doc = MarkdownDocument.from_file(str(self._raw_path))
-            return self._doc
+            self._doc = doc
+            return doc
         except Exception:
             self._cleanup_entry()
             raise
@@ -111,14 +163,26 @@ class MdEdit:
     def __exit__(self, exc_type, exc, tb) -> bool:
         try:
             if exc_type is not None:
+                if self._ambiguity_installed and _is_ambiguity_exception(
+                    exc_type, exc
+                ):
+                    raise OperationFailedError(
+                        f"Ambiguity detected: {exc}"
+                    ) from exc
                 return False
 
             if not self._commit:
                 return False
 
-            assert self._doc is not None, "Document should be available on exit"
+            # __enter__ guarantees self._doc is set on any clean exit.
+            doc = self._doc
 
-            self._pre_commit()
+            try:
+                self._pre_commit()
+            except AmbiguityWarning as warning:
+                raise OperationFailedError(
+                    f"Ambiguity detected: {warning}"
+                ) from warning
 
             if self._check_stale:
                 self._ensure_not_stale()
@@ -126,10 +190,13 @@ class MdEdit:
             if self._preview_diff:
                 self._print_diff()
 
-            self._doc.write_in_place(backup=self._backup)
+            # write_in_place skips the backup and atomic rewrite itself when
+            # the rendered document matches the source text (no-op session).
+            doc.write_in_place(backup=self._backup)
             return False
         finally:
-            self._restore_warnings()
+            if self._ambiguity_installed:
+                self._restore_warnings()
             self._active_paths.discard(self._resolved_path)
 
     # Hooks --------------------------------------------------------------
@@ -140,62 +207,44 @@ class MdEdit:
     def _install_ambiguity_filter(self) -> None:
         self._warnings_cm = warnings.catch_warnings()
         self._warnings_cm.__enter__()
-        warnings.filterwarnings(
-            "always",
-            category=UserWarning,
-            module=r"^md_splice(\\.|$)",
-        )
-        self._previous_showwarning = warnings.showwarning
-
-        previous = self._previous_showwarning
-
-        def _raise_on_warning(
-            message, category, filename, lineno, file=None, line=None
-        ) -> None:
-            if category is UserWarning and _AMBIGUITY_WARNING_SNIPPET in str(message):
-                raise OperationFailedError(f"Ambiguity detected: {message}")
-            if previous is not None:
-                previous(message, category, filename, lineno, file=file, line=line)
-                return
-
-            original = getattr(warnings, "_showwarning_orig", None)
-            if original is not None:  # pragma: no cover - safety net
-                original(message, category, filename, lineno, file=file, line=line)
-            else:  # pragma: no cover - ultimate fallback
-                raise category(message)
-
-        warnings.showwarning = _raise_on_warning  # type: ignore[assignment]
+        for entry in _AMBIGUITY_ERROR_FILTERS:
+            warnings.filters.insert(0, entry)
+        warnings._filters_mutated()
+        self._ambiguity_installed = True
 
     def _restore_warnings(self) -> None:
-        if self._previous_showwarning is not None:
-            warnings.showwarning = self._previous_showwarning  # type: ignore[assignment]
-            self._previous_showwarning = None
-
-        if self._warnings_cm is not None:
-            self._warnings_cm.__exit__(None, None, None)
-            self._warnings_cm = None
+        # Only called when _install_ambiguity_filter ran to completion, so
+        # the context manager is present and restores the filter list.
+        self._warnings_cm.__exit__(None, None, None)
+        self._warnings_cm = None
+        self._ambiguity_installed = False
 
     def _ensure_not_stale(self) -> None:
-        assert self._stale_token is not None, "Stale token missing"
         stat_info = os.stat(self._resolved_path)
-        current = _StaleToken(stat_info.st_mtime_ns, stat_info.st_size)
-        if (current.mtime_ns, current.size) != (
-            self._stale_token.mtime_ns,
-            self._stale_token.size,
+        # Size diverges in most real edits, so test it first; mtime and the
+        # inode/device pair only run when sizes still agree.
+        if (
+            stat_info.st_size != self._stale_size
+            or stat_info.st_mtime_ns != self._stale_mtime_ns
+            or stat_info.st_ino != self._stale_ino
+            or stat_info.st_dev != self._stale_dev
         ):
             raise RuntimeError(
                 f"Refusing to write '{self._raw_path}': file changed on disk"
             )
 
     def _print_diff(self) -> None:
-        assert self._doc is not None
-        before = self._resolved_path.read_text(encoding="utf-8")
-        after = self._doc.render()
-        diff = diff_unified(before, after, fromfile="original", tofile="modified")
-        print(diff, end="")
+        diff = diff_unified_from_file(
+            str(self._resolved_path),
+            self._doc,
+            fromfile="original",
+            tofile="modified",
+        )
+        sys.stdout.write(diff)
 
     def _cleanup_entry(self) -> None:
-        self._restore_warnings()
+        if self._ambiguity_installed:
+            self._restore_warnings()
         self._active_paths.discard(self._resolved_path)
 
 
@@ -218,8 +267,14 @@ class MdBatchEdit(MdEdit):
         return self
 
     def apply(self, op: Operation) -> None:
-        if not isinstance(op, _OPERATION_TYPES):
-            expected = ", ".join(cls.__name__ for cls in _OPERATION_TYPES)
+        """Queue ``op`` for the commit-time batch.
+
+        Only the concrete operation types from :mod:`md_splice.types` are
+        accepted; subclasses are rejected since the native layer dispatches on
+        the exact class.
+        """
+        if type(op) not in OP_TAGS:
+            expected = ", ".join(sorted(cls.__name__ for cls in OP_TAGS))
             raise TypeError(
                 f"Unsupported operation type {type(op).__name__}; expected one of: {expected}"
             )
@@ -227,5 +282,4 @@ class MdBatchEdit(MdEdit):
 
     def _pre_commit(self) -> None:
         if self._batched_ops:
-            assert self._doc is not None
             self._doc.apply(self._batched_ops)
@@ -1,13 +1,19 @@
 """Python exception hierarchy for the md-splice bindings.
 
 Each exception mirrors a Rust ``SpliceError`` variant so Python callers can
-write precise ``except`` clauses. The base :class:`MdSpliceError` is surfaced
-from the native extension but documented here for discoverability.
+write precise ``except`` clauses. The base :class:`MdSpliceError` and the
+:class:`AmbiguityWarning` category are surfaced from the native extension but
+re-exported here for discoverability.
+
+The subclasses are trivial ``class FooError(MdSpliceError)`` stanzas, so they
+are generated in bulk from a ``(name, docstring)`` table; one ``type()`` call
+per class is considerably cheaper at import time than a full class-definition
+block, and the table keeps names and docs from drifting apart.
 """
 
 from __future__ import annotations
 
-from ._native import MdSpliceError
+from ._native import AmbiguityWarning, MdSpliceError
 
 if not MdSpliceError.__doc__:
     MdSpliceError.__doc__ = (
@@ -15,121 +21,107 @@ if not MdSpliceError.__doc__:
     )
 
 
-class NodeNotFoundError(MdSpliceError):
-    """Raised when a selector fails to match any nodes in the document."""
-
-
-class InvalidChildInsertionError(MdSpliceError):
-    """Raised when attempting to insert a child into an incompatible node."""
-
-
-class AmbiguousContentSourceError(MdSpliceError):
-    """Raised when multiple mutually-exclusive content sources are provided."""
-
-
-class NoContentError(MdSpliceError):
-    """Raised when an operation that requires content receives none."""
-
-
-class InvalidListItemContentError(MdSpliceError):
-    """Raised when list-item operations receive non-list Markdown content."""
-
-
-class AmbiguousStdinSourceError(MdSpliceError):
-    """Raised when both the source document and splice content read from stdin."""
-
-
-class InvalidSectionDeleteError(MdSpliceError):
-    """Raised when deleting a section from a non-heading target."""
-
-
-class SectionRequiresHeadingError(MdSpliceError):
-    """Raised when section semantics are requested on a non-heading selector."""
-
-
-class ConflictingScopeError(MdSpliceError):
-    """Raised when `after` and `within` scopes are combined in a selector."""
-
-
-class RangeRequiresBlockError(MdSpliceError):
-    """Raised when range selectors are applied to non-block selections."""
-
-
-class FrontmatterMissingError(MdSpliceError):
-    """Raised when attempting to mutate or read frontmatter that does not exist."""
-
-
-class FrontmatterKeyNotFoundError(MdSpliceError):
-    """Raised when a requested frontmatter key path is absent."""
-
-
-class FrontmatterParseError(MdSpliceError):
-    """Raised when frontmatter parsing fails."""
-
-
-class FrontmatterSerializeError(MdSpliceError):
-    """Raised when converting Python values to frontmatter fails."""
-
-
-class MarkdownParseError(MdSpliceError):
-    """Raised when the Markdown source cannot be parsed."""
-
-
-class OperationParseError(MdSpliceError):
-    """Raised when an operations file cannot be parsed."""
-
-
-class OperationFailedError(MdSpliceError):
-    """Raised when an operation fails during execution."""
-
-
-class IoError(MdSpliceError):
-    """Raised for underlying I/O errors."""
-
-
-class InvalidRegexError(MdSpliceError):
-    """Raised when a provided regular expression pattern is invalid."""
-
-
-class SelectorAliasNotDefinedError(MdSpliceError):
-    """Raised when a selector alias reference has not been defined."""
-
-
-class SelectorAliasAlreadyDefinedError(MdSpliceError):
-    """Raised when attempting to redefine an existing selector alias."""
-
-
-class AmbiguousSelectorSourceError(MdSpliceError):
-    """Raised when both selector and selector_ref inputs are provided."""
-
-
-class AmbiguousNestedSelectorSourceError(MdSpliceError):
-    """Raised when nested selectors specify both inline and referenced handles."""
-
+_ERRORS = (
+    (
+        "NodeNotFoundError",
+        "Raised when a selector fails to match any nodes in the document.",
+    ),
+    (
+        "InvalidChildInsertionError",
+        "Raised when attempting to insert a child into an incompatible node.",
+    ),
+    (
+        "AmbiguousContentSourceError",
+        "Raised when multiple mutually-exclusive content sources are provided.",
+    ),
+    (
+        "NoContentError",
+        "Raised when an operation that requires content receives none.",
+    ),
+    (
+        "InvalidListItemContentError",
+        "Raised when list-item operations receive non-list Markdown content.",
+    ),
+    (
+        "AmbiguousStdinSourceError",
+        "Raised when both the source document and splice content read from stdin.",
+    ),
+    (
+        "InvalidSectionDeleteError",
+        "Raised when deleting a section from a non-heading target.",
+    ),
+    (
+        "SectionRequiresHeadingError",
+        "Raised when section semantics are requested on a non-heading selector.",
+    ),
+    (
+        "ConflictingScopeError",
+        "Raised when `after` and `within` scopes are combined in a selector.",
+    ),
+    (
+        "RangeRequiresBlockError",
+        "Raised when range selectors are applied to non-block selections.",
+    ),
+    (
+        "FrontmatterMissingError",
+        "Raised when attempting to mutate or read frontmatter that does not exist.",
+    ),
+    (
+        "FrontmatterKeyNotFoundError",
+        "Raised when a requested frontmatter key path is absent.",
+    ),
+    (
+        "FrontmatterParseError",
+        "Raised when frontmatter parsing fails.",
+    ),
+    (
+        "FrontmatterSerializeError",
+        "Raised when converting Python values to frontmatter fails.",
+    ),
+    (
+        "MarkdownParseError",
+        "Raised when the Markdown source cannot be parsed.",
+    ),
+    (
+        "OperationParseError",
+        "Raised when an operations file cannot be parsed.",
+    ),
+    (
+        "OperationFailedError",
+        "Raised when an operation fails during execution.",
+    ),
+    (
+        "IoError",
+        "Raised for underlying I/O errors.",
+    ),
+    (
+        "InvalidRegexError",
+        "Raised when a provided regular expression pattern is invalid.",
+    ),
+    (
+        "SelectorAliasNotDefinedError",
+        "Raised when a selector alias reference has not been defined.",
+    ),
+    (
+        "SelectorAliasAlreadyDefinedError",
+        "Raised when attempting to redefine an existing selector alias.",
+    ),
+    (
+        "AmbiguousSelectorSourceError",
+        "Raised when both selector and selector_ref inputs are provided.",
+    ),
+    (
+        "AmbiguousNestedSelectorSourceError",
+        "Raised when nested selectors specify both inline and referenced handles.",
+    ),
+)
+
+for _name, _doc in _ERRORS:
+    globals()[_name] = type(
+        _name, (MdSpliceError,), {"__doc__": _doc, "__module__": __name__}
+    )
+del _name, _doc
 
-__all__ = [
-    "MdSpliceError",
-    "NodeNotFoundError",
-    "InvalidChildInsertionError",
-    "AmbiguousContentSourceError",
-    "NoContentError",
-    "InvalidListItemContentError",
-    "AmbiguousStdinSourceError",
-    "InvalidSectionDeleteError",
-    "SectionRequiresHeadingError",
-    "ConflictingScopeError",
-    "RangeRequiresBlockError",
-    "FrontmatterMissingError",
-    "FrontmatterKeyNotFoundError",
-    "FrontmatterParseError",
-    "FrontmatterSerializeError",
-    "MarkdownParseError",
-    "OperationParseError",
-    "OperationFailedError",
-    "IoError",
-    "InvalidRegexError",
-    "SelectorAliasNotDefinedError",
-    "SelectorAliasAlreadyDefinedError",
-    "AmbiguousSelectorSourceError",
-    "AmbiguousNestedSelectorSourceError",
-]
+# Re-exported here so callers can filter or catch ambiguity warnings without
+# reaching into the private ``_native`` module.
+__all__ = ["MdSpliceError", "AmbiguityWarning", *(name for name, _ in _ERRORS)]
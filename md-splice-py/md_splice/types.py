@@ -1,14 +1,78 @@
-"""Public data types for the md-splice Python bindings."""
+"""Public data types for the md-splice Python bindings.
+
+The selector and operation dataclasses compare by identity (``eq=False``):
+structural comparison would recurse through nested selectors for no caller
+benefit. Compare :func:`md_splice.dumps_operations` output when structural
+equality is genuinely needed.
+"""
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import MISSING, dataclass, field, fields
 from enum import Enum
+import functools
 import re
-from typing import Any, Pattern, Union
+import sys
+from typing import Any, ClassVar, Iterable, Pattern, Union
 
 from .errors import ConflictingScopeError, InvalidRegexError
 
+# Regex flags the Rust bridge honors; anything else is rejected eagerly at
+# Selector construction so malformed patterns never reach the FFI boundary.
+# An allow-list fails closed: flags added to ``re`` in future Python versions
+# are rejected by the same single bit test instead of slipping through.
+_ALLOWED_REGEX_FLAGS = re.IGNORECASE | re.MULTILINE | re.DOTALL | re.UNICODE
+
+
+def _require_selector_xor(sel: object, ref: object, op: str) -> None:
+    if (sel is None) == (ref is None):
+        raise ValueError(
+            f"{op} requires exactly one of 'selector' or 'selector_ref'."
+        )
+
+
+def _require_until_xor(until: object, ref: object, op: str) -> None:
+    if until is not None and ref is not None:
+        raise ValueError(f"{op} requires exactly one of 'until' or 'until_ref'.")
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_selector_regex(pattern: str) -> re.Pattern[str]:
+    """Compile ``pattern``, amortizing repeats beyond ``re``'s own 512-entry
+    cache for workloads that build many selectors over distinct patterns."""
+    return re.compile(pattern)
+
+
+def _reject_unsupported_regex_flags(flags: int) -> None:
+    unsupported = flags & ~_ALLOWED_REGEX_FLAGS
+    if unsupported:
+        raise InvalidRegexError(
+            f"Unsupported regex flag(s): {re.RegexFlag(unsupported)!s}"
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def _field_defaults(cls: type) -> tuple[tuple[str, Any], ...]:
+    return tuple((f.name, f.default) for f in fields(cls))
+
+
+def _make_unchecked(cls: type, kwargs: dict[str, Any]) -> Any:
+    """Build ``cls`` without running __init__/__post_init__ validation.
+
+    Backs the ``_make`` fast paths used for input that has already been
+    validated (e.g. by the Rust loader). Regex patterns must already be
+    compiled; no checks of any kind are performed. Keys in ``kwargs`` that
+    are not fields of ``cls`` are silently dropped, so a typoed field name
+    yields a default-valued instance rather than an error.
+    """
+    obj = object.__new__(cls)
+    for name, default in _field_defaults(cls):
+        value = kwargs.get(name, default)
+        if value is MISSING:
+            raise TypeError(f"{cls.__name__}._make() missing required field {name!r}")
+        object.__setattr__(obj, name, value)
+    return obj
+
 
 class FrontmatterFormat(str, Enum):
     """Frontmatter serialization format detected in a Markdown document."""
@@ -26,7 +90,14 @@ class InsertPosition(str, Enum):
     APPEND_CHILD = "append_child"
 
 
-@dataclass(frozen=True, slots=True)
+# Intern the enum payload strings so repeated marshaling across the FFI
+# boundary (and dict lookups keyed on the values) can compare by pointer.
+for _member in (*InsertPosition, *FrontmatterFormat):
+    _member._value_ = sys.intern(_member.value)
+del _member
+
+
+@dataclass(frozen=True, slots=True, eq=False)
 class Selector:
     """Criteria for locating Markdown nodes via the Rust core.
 
@@ -49,16 +120,73 @@ class Selector:
     within: Selector | None = None
     within_ref: str | None = None
 
-    def __post_init__(self) -> None:  # noqa: D401 - dataclass validation hook
-        has_after = self.after is not None or self.after_ref is not None
-        has_within = self.within is not None or self.within_ref is not None
+    @classmethod
+    def _make(cls, **kwargs: Any) -> Selector:
+        """Construct without validation; for pre-validated input only.
+
+        Unknown keyword arguments are silently dropped.
+        """
+        return _make_unchecked(cls, kwargs)
+
+    @classmethod
+    def create(
+        cls, *, select_regex: Pattern[str] | str | None = None, **kwargs: Any
+    ) -> Selector:
+        """Construct a Selector, compiling ``select_regex`` up front.
+
+        String patterns are compiled before the frozen instance is built, so
+        ``__post_init__`` takes the already-compiled fast path and never has
+        to mutate the sealed slot via ``object.__setattr__``.
+        """
+        if type(select_regex) is str:
+            try:
+                select_regex = _compile_selector_regex(select_regex)
+            except re.error as exc:
+                raise InvalidRegexError(str(exc)) from exc
+        return cls(select_regex=select_regex, **kwargs)
+
+    @classmethod
+    def of(cls, **kwargs: Any) -> Selector:
+        """Return a shared Selector for ``kwargs``, constructing at most once.
+
+        Repeated calls with equal keyword arguments return the same frozen
+        instance, skipping validation and regex compilation on cache hits.
+        Arguments must be hashable (nested selectors hash by identity).
+        Recommended for hot loops that rebuild identical selectors.
+        """
+        return _shared_selector(tuple(sorted(kwargs.items())))
+
+    @classmethod
+    def prewarm(cls, patterns: Iterable[str]) -> None:
+        """Bulk-compile ``patterns`` into the selector regex cache.
+
+        Call before a large batch job so the hot construction loop hits only
+        cache lookups instead of paying regex compilation mid-batch. Invalid
+        patterns raise :class:`md_splice.errors.InvalidRegexError`, matching
+        the other selector construction paths.
+        """
+        for pattern in patterns:
+            try:
+                _compile_selector_regex(pattern)
+            except re.error as exc:
+                raise InvalidRegexError(str(exc)) from exc
 
-        if self.after is not None and self.after_ref is not None:
+    def __post_init__(self) -> None:  # noqa: D401 - dataclass validation hook
+        # Bind the scope fields once; the dominant all-None case then runs
+        # three short-circuiting None tests over locals instead of repeated
+        # attribute loads.
+        after = self.after
+        after_ref = self.after_ref
+        within = self.within
+        within_ref = self.within_ref
+
+        if after is not None and after_ref is not None:
             raise ValueError("Cannot specify both 'after' and 'after_ref'.")
-        if self.within is not None and self.within_ref is not None:
+        if within is not None and within_ref is not None:
             raise ValueError("Cannot specify both 'within' and 'within_ref'.")
-
-        if has_after and has_within:
+        if (after is not None or after_ref is not None) and (
+            within is not None or within_ref is not None
+        ):
             raise ConflictingScopeError(
                 "Selector cannot specify both 'after' and 'within' scopes."
             )
@@ -67,20 +195,42 @@ class Selector:
             raise ValueError("select_ordinal must be a positive integer")
 
         pattern = self.select_regex
-        if isinstance(pattern, str):
+        if pattern is None:
+            return
+        if type(pattern) is re.Pattern:
+            # Hot path: already compiled (re.Pattern cannot be subclassed, so
+            # an exact type test suffices). Only the flag mask is checked.
+            _reject_unsupported_regex_flags(pattern.flags)
+            return
+        if type(pattern) is str:
+            # Exact type test: str cannot meaningfully be subclassed here and
+            # avoids the MRO walk isinstance would perform per Selector.
             try:
-                compiled = re.compile(pattern)
+                compiled = _compile_selector_regex(pattern)
             except re.error as exc:  # pragma: no cover - exercised in tests
                 raise InvalidRegexError(str(exc)) from exc
+            _reject_unsupported_regex_flags(compiled.flags)
+            object.__setattr__(self, "select_regex", compiled)
+        elif isinstance(pattern, str):  # pragma: no cover - str subclass
+            try:
+                compiled = _compile_selector_regex(str(pattern))
+            except re.error as exc:
+                raise InvalidRegexError(str(exc)) from exc
+            _reject_unsupported_regex_flags(compiled.flags)
             object.__setattr__(self, "select_regex", compiled)
-        elif pattern is None or isinstance(pattern, re.Pattern):
-            # Already compiled or absent; no action needed.
-            pass
         else:  # pragma: no cover - defensive branch
             raise TypeError("select_regex must be a str, compiled Pattern, or None")
 
 
-@dataclass(frozen=True, slots=True)
+# Flyweight backing Selector.of(); keyed on the sorted kwargs items. A plain
+# lru_cache is used rather than a WeakValueDictionary because slotted
+# dataclasses carry no __weakref__ slot.
+@functools.lru_cache(maxsize=256)
+def _shared_selector(items: tuple[tuple[str, Any], ...]) -> Selector:
+    return Selector(**dict(items))
+
+
+@dataclass(frozen=True, slots=True, eq=False)
 class InsertOperation:
     """Insert Markdown content relative to a selector.
 
@@ -89,19 +239,26 @@ class InsertOperation:
     defined in ``goal-Python-library/Specification.md``.
     """
 
+    _op_tag: ClassVar[int] = 0
+
     selector: Selector | None = None
     selector_ref: str | None = None
     content: str | None = None
     position: InsertPosition = InsertPosition.AFTER
 
+    @classmethod
+    def _make(cls, **kwargs: Any) -> InsertOperation:
+        """Construct without validation; for pre-validated input only.
+
+        Unknown keyword arguments are silently dropped.
+        """
+        return _make_unchecked(cls, kwargs)
+
     def __post_init__(self) -> None:
-        if (self.selector is None) == (self.selector_ref is None):
-            raise ValueError(
-                "InsertOperation requires exactly one of 'selector' or 'selector_ref'."
-            )
+        _require_selector_xor(self.selector, self.selector_ref, "InsertOperation")
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class ReplaceOperation:
     """Replace Markdown matched by a selector, optionally up to ``until``.
 
@@ -110,24 +267,28 @@ class ReplaceOperation:
     transaction semantics.
     """
 
+    _op_tag: ClassVar[int] = 1
+
     selector: Selector | None = None
     selector_ref: str | None = None
     content: str | None = None
     until: Selector | None = None
     until_ref: str | None = None
 
+    @classmethod
+    def _make(cls, **kwargs: Any) -> ReplaceOperation:
+        """Construct without validation; for pre-validated input only.
+
+        Unknown keyword arguments are silently dropped.
+        """
+        return _make_unchecked(cls, kwargs)
+
     def __post_init__(self) -> None:
-        if (self.selector is None) == (self.selector_ref is None):
-            raise ValueError(
-                "ReplaceOperation requires exactly one of 'selector' or 'selector_ref'."
-            )
-        if self.until is not None and self.until_ref is not None:
-            raise ValueError(
-                "ReplaceOperation requires exactly one of 'until' or 'until_ref'."
-            )
+        _require_selector_xor(self.selector, self.selector_ref, "ReplaceOperation")
+        _require_until_xor(self.until, self.until_ref, "ReplaceOperation")
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class DeleteOperation:
     """Delete Markdown matched by a selector.
 
@@ -136,24 +297,28 @@ class DeleteOperation:
     selector. Both behaviors mirror the CLI and Rust core.
     """
 
+    _op_tag: ClassVar[int] = 2
+
     selector: Selector | None = None
     selector_ref: str | None = None
     section: bool = False
     until: Selector | None = None
     until_ref: str | None = None
 
+    @classmethod
+    def _make(cls, **kwargs: Any) -> DeleteOperation:
+        """Construct without validation; for pre-validated input only.
+
+        Unknown keyword arguments are silently dropped.
+        """
+        return _make_unchecked(cls, kwargs)
+
     def __post_init__(self) -> None:
-        if (self.selector is None) == (self.selector_ref is None):
-            raise ValueError(
-                "DeleteOperation requires exactly one of 'selector' or 'selector_ref'."
-            )
-        if self.until is not None and self.until_ref is not None:
-            raise ValueError(
-                "DeleteOperation requires exactly one of 'until' or 'until_ref'."
-            )
+        _require_selector_xor(self.selector, self.selector_ref, "DeleteOperation")
+        _require_until_xor(self.until, self.until_ref, "DeleteOperation")
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class SetFrontmatterOperation:
     """Assign a value at the given frontmatter key path.
 
@@ -162,19 +327,39 @@ class SetFrontmatterOperation:
     layer.
     """
 
+    _op_tag: ClassVar[int] = 3
+
     key: str
     value: Any
     format: FrontmatterFormat | None = None
 
+    @classmethod
+    def _make(cls, **kwargs: Any) -> SetFrontmatterOperation:
+        """Construct without validation; for pre-validated input only.
 
-@dataclass(frozen=True, slots=True)
+        Unknown keyword arguments are silently dropped.
+        """
+        return _make_unchecked(cls, kwargs)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
 class DeleteFrontmatterOperation:
     """Remove a key from document frontmatter."""
 
+    _op_tag: ClassVar[int] = 4
+
     key: str
 
+    @classmethod
+    def _make(cls, **kwargs: Any) -> DeleteFrontmatterOperation:
+        """Construct without validation; for pre-validated input only.
 
-@dataclass(frozen=True, slots=True)
+        Unknown keyword arguments are silently dropped.
+        """
+        return _make_unchecked(cls, kwargs)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
 class ReplaceFrontmatterOperation:
     """Replace the entire frontmatter payload.
 
@@ -183,9 +368,19 @@ class ReplaceFrontmatterOperation:
     frontmatter, aligning with the specification's rules for new blocks.
     """
 
+    _op_tag: ClassVar[int] = 5
+
     content: Any
     format: FrontmatterFormat | None = None
 
+    @classmethod
+    def _make(cls, **kwargs: Any) -> ReplaceFrontmatterOperation:
+        """Construct without validation; for pre-validated input only.
+
+        Unknown keyword arguments are silently dropped.
+        """
+        return _make_unchecked(cls, kwargs)
+
 
 Operation = Union[
     InsertOperation,
@@ -196,6 +391,21 @@ Operation = Union[
     ReplaceFrontmatterOperation,
 ]
 
+# Class-keyed dispatch table: ``OP_TAGS[type(op)]`` resolves an operation to a
+# stable integer tag with one dict lookup instead of an isinstance chain, and
+# doubles as the authoritative membership set for exact-type validation.
+OP_TAGS: dict[type, int] = {
+    cls: cls._op_tag
+    for cls in (
+        InsertOperation,
+        ReplaceOperation,
+        DeleteOperation,
+        SetFrontmatterOperation,
+        DeleteFrontmatterOperation,
+        ReplaceFrontmatterOperation,
+    )
+}
+
 
 __all__ = [
     "FrontmatterFormat",
@@ -208,4 +418,5 @@ __all__ = [
     "DeleteFrontmatterOperation",
     "ReplaceFrontmatterOperation",
     "Operation",
+    "OP_TAGS",
 ]
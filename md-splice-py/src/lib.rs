@@ -1,8 +1,10 @@
 use std::{
+    collections::HashMap,
     fs,
     io::{self, Write},
     path::{Path, PathBuf},
     str::FromStr,
+    sync::{Mutex, OnceLock},
 };
 
 use markdown_ppp::ast::{Block, Document, HeadingKind, SetextHeading};
@@ -26,6 +28,7 @@ use pyo3::{
     conversion::IntoPyObjectExt,
     create_exception,
     exceptions::{PyException, PyTypeError, PyValueError},
+    intern,
     prelude::*,
     types::{PyAny, PyAnyMethods, PyDict, PyList, PyModule, PyString, PyTuple, PyType},
     Bound,
@@ -37,6 +40,48 @@ use similar::TextDiff;
 use tempfile::Builder as TempFileBuilder;
 
 create_exception!(_native, MdSpliceError, PyException);
+create_exception!(
+    _native,
+    AmbiguityWarning,
+    pyo3::exceptions::PyUserWarning,
+    "Warning category emitted when a selector matches more than one node."
+);
+
+/// Upper bound on source length eligible for the parse cache; larger
+/// documents are unlikely to repeat and would dominate the cache memory.
+const PARSE_CACHE_MAX_SOURCE_LEN: usize = 16 * 1024;
+/// Number of parsed documents retained; the cache is wholesale-cleared when
+/// full, which is adequate for the repeated-fixture workloads it targets.
+const PARSE_CACHE_CAPACITY: usize = 64;
+
+static PARSE_CACHE: OnceLock<Mutex<HashMap<String, CoreMarkdownDocument>>> = OnceLock::new();
+
+/// Parse `markdown`, serving repeated small inputs from a process-wide cache.
+///
+/// Property tests and batch pipelines frequently re-parse identical short
+/// sources; a cache hit costs one AST clone instead of a full parse. Keys are
+/// the source text itself, so hits are exact by construction.
+fn parse_cached(markdown: &str) -> Result<CoreMarkdownDocument, SpliceError> {
+    if markdown.len() > PARSE_CACHE_MAX_SOURCE_LEN {
+        return CoreMarkdownDocument::from_str(markdown);
+    }
+
+    let cache = PARSE_CACHE.get_or_init(|| Mutex::new(HashMap::new()));
+    if let Ok(guard) = cache.lock() {
+        if let Some(document) = guard.get(markdown) {
+            return Ok(document.clone());
+        }
+    }
+
+    let document = CoreMarkdownDocument::from_str(markdown)?;
+    if let Ok(mut guard) = cache.lock() {
+        if guard.len() >= PARSE_CACHE_CAPACITY {
+            guard.clear();
+        }
+        guard.insert(markdown.to_string(), document.clone());
+    }
+    Ok(document)
+}
 
 /// AST-backed Markdown document that mirrors the `md-splice` Rust core.
 ///
@@ -47,6 +92,10 @@ create_exception!(_native, MdSpliceError, PyException);
 pub struct PyMarkdownDocument {
     inner: CoreMarkdownDocument,
     source_path: Option<PathBuf>,
+    /// Original source text, retained so :meth:`is_dirty` can detect no-op
+    /// sessions without re-reading the file. ``None`` for documents whose
+    /// provenance is unknown, which conservatively reports dirty.
+    source_text: Option<String>,
 }
 
 #[pymethods]
@@ -58,10 +107,11 @@ impl PyMarkdownDocument {
     /// operations, and rendered back to Markdown with :meth:`render`.
     #[classmethod]
     pub fn from_string(_cls: &Bound<'_, PyType>, markdown: &str) -> PyResult<Self> {
-        let document = CoreMarkdownDocument::from_str(markdown).map_err(map_splice_error)?;
+        let document = parse_cached(markdown).map_err(map_splice_error)?;
         Ok(Self {
             inner: document,
             source_path: None,
+            source_text: Some(markdown.to_string()),
         })
     }
 
@@ -78,6 +128,33 @@ impl PyMarkdownDocument {
         Ok(Self {
             inner: document,
             source_path: Some(path_buf),
+            source_text: Some(content),
+        })
+    }
+
+    /// Load Markdown from an already-open file descriptor (POSIX only).
+    ///
+    /// Ownership of ``fd`` transfers to Rust, which closes it after reading.
+    /// Callers that have already opened and ``fstat``-ed the file avoid the
+    /// second open/stat round-trip that :meth:`from_file` would perform.
+    /// ``path`` optionally associates the document with a file so
+    /// :meth:`write_in_place` can persist changes.
+    #[cfg(unix)]
+    #[classmethod]
+    #[pyo3(signature = (fd, *, path=None))]
+    pub fn from_fd(_cls: &Bound<'_, PyType>, fd: i32, path: Option<PathBuf>) -> PyResult<Self> {
+        use std::io::Read;
+        use std::os::unix::io::FromRawFd;
+
+        let mut file = unsafe { fs::File::from_raw_fd(fd) };
+        let mut content = String::new();
+        file.read_to_string(&mut content).map_err(map_io_error)?;
+        let document = CoreMarkdownDocument::from_str(&content).map_err(map_splice_error)?;
+
+        Ok(Self {
+            inner: document,
+            source_path: path,
+            source_text: Some(content),
         })
     }
 
@@ -95,22 +172,45 @@ impl PyMarkdownDocument {
     /// a ``path~`` sibling before the atomic replace occurs. This mirrors the
     /// CLI's safety guarantees described in the specification.
     #[pyo3(signature = (*, backup=false))]
-    pub fn write_in_place(&self, backup: bool) -> PyResult<()> {
+    pub fn write_in_place(&mut self, backup: bool) -> PyResult<()> {
         let Some(path) = &self.source_path else {
             return Err(map_splice_error(SpliceError::Io(
                 "Document has no associated path; call write_to() instead.".to_string(),
             )));
         };
 
+        // No-op sessions skip the backup and the temp-file/rename dance
+        // entirely; the dirty path pays only this comparison on top of the
+        // render it needs anyway.
+        let rendered = self.inner.render();
+        if let Some(source) = &self.source_text {
+            if rendered_matches_source(&rendered, source) {
+                return Ok(());
+            }
+        }
+
         if backup {
             create_backup(path.as_path())?;
         }
 
-        let rendered = self.inner.render();
         write_atomic(path.as_path(), rendered.as_str())?;
+        self.source_text = Some(rendered);
         Ok(())
     }
 
+    /// Report whether :meth:`write_in_place` would change the document.
+    ///
+    /// Returns ``False`` when the rendered document matches the text the
+    /// document was loaded from (or last written), modulo the trailing
+    /// newline the printer drops; documents with unknown provenance always
+    /// report ``True``.
+    pub fn is_dirty(&self) -> bool {
+        match &self.source_text {
+            Some(source) => !rendered_matches_source(&self.inner.render(), source),
+            None => true,
+        }
+    }
+
     /// Render the document and write it to ``path`` atomically.
     ///
     /// Unlike :meth:`write_in_place`, this method always targets the provided
@@ -142,6 +242,29 @@ impl PyMarkdownDocument {
         Ok(())
     }
 
+    /// Apply operations provided as pre-serialized YAML or JSON text.
+    ///
+    /// The whole batch crosses the FFI boundary as a single string and is
+    /// deserialized with serde on the Rust side, avoiding per-operation
+    /// attribute reads. ``format`` follows the same rules as
+    /// :func:`loads_operations`; ambiguity handling matches :meth:`apply`.
+    #[pyo3(signature = (text, *, format=None, warn_on_ambiguity=true))]
+    pub fn apply_serialized(
+        &mut self,
+        py: Python<'_>,
+        text: &str,
+        format: Option<&str>,
+        warn_on_ambiguity: bool,
+    ) -> PyResult<()> {
+        let operations = parse_operations(text, format).map_err(map_splice_error)?;
+        let outcome = self
+            .inner
+            .apply_with_ambiguity(operations)
+            .map_err(map_splice_error)?;
+        maybe_emit_ambiguity_warning(py, warn_on_ambiguity, outcome)?;
+        Ok(())
+    }
+
     /// Preview a list of operations without mutating the original document.
     ///
     /// The operations run against a clone and the rendered Markdown is
@@ -246,7 +369,7 @@ impl PyMarkdownDocument {
         };
 
         let types_module = py.import("md_splice.types")?;
-        let enum_class = types_module.getattr("FrontmatterFormat")?;
+        let enum_class = types_module.getattr(intern!(py, "FrontmatterFormat"))?;
 
         let variant_name = match format {
             FrontmatterFormat::Yaml => "YAML",
@@ -262,6 +385,7 @@ impl PyMarkdownDocument {
         Ok(Self {
             inner: self.inner.clone(),
             source_path: self.source_path.clone(),
+            source_text: self.source_text.clone(),
         })
     }
 }
@@ -271,7 +395,9 @@ fn _native(py: Python, module: &Bound<'_, PyModule>) -> PyResult<()> {
     module.add("__version__", env!("CARGO_PKG_VERSION"))?;
     module.add_class::<PyMarkdownDocument>()?;
     module.add("MdSpliceError", py.get_type::<MdSpliceError>())?;
+    module.add("AmbiguityWarning", py.get_type::<AmbiguityWarning>())?;
     module.add_function(pyo3::wrap_pyfunction!(diff_unified, module)?)?;
+    module.add_function(pyo3::wrap_pyfunction!(diff_unified_from_file, module)?)?;
     module.add_function(pyo3::wrap_pyfunction!(loads_operations, module)?)?;
     module.add_function(pyo3::wrap_pyfunction!(dumps_operations, module)?)?;
     Ok(())
@@ -330,13 +456,11 @@ fn maybe_emit_ambiguity_warning(
 ) -> PyResult<()> {
     if warn_on_ambiguity && outcome.ambiguity_detected {
         let warnings = py.import("warnings")?;
-        let builtins = py.import("builtins")?;
-        let warning_type = builtins.getattr("UserWarning")?;
         warnings.call_method1(
             "warn",
             (
                 "Selector matched multiple nodes; first match used.",
-                warning_type,
+                py.get_type::<AmbiguityWarning>(),
             ),
         )?;
     }
@@ -349,7 +473,9 @@ fn py_operations_to_rust(
     operations: &Bound<'_, PyAny>,
 ) -> PyResult<Vec<TxOperation>> {
     let iterator = operations.try_iter()?;
-    let mut converted = Vec::new();
+    // Lists and tuples report their length up front; size the Vec once so
+    // large batches do not reallocate while converting.
+    let mut converted = Vec::with_capacity(operations.len().unwrap_or(0));
     for item in iterator {
         let bound = item?;
         converted.push(py_operation_to_rust(py, &bound)?);
@@ -358,22 +484,26 @@ fn py_operations_to_rust(
 }
 
 fn py_operation_to_rust(py: Python<'_>, operation: &Bound<'_, PyAny>) -> PyResult<TxOperation> {
-    let class = operation.getattr("__class__")?;
-    let name: String = class.getattr("__name__")?.extract()?;
+    let class = operation.getattr(intern!(py, "__class__"))?;
+    let name_obj = class.getattr(intern!(py, "__name__"))?;
+    // Borrow the class name instead of copying it into a String per op.
+    let name = name_obj.extract::<&str>()?;
 
-    match name.as_str() {
+    match name {
         "InsertOperation" => {
-            let selector_obj = operation.getattr("selector")?;
+            let selector_obj = operation.getattr(intern!(py, "selector"))?;
             let selector = if selector_obj.is_none() {
                 None
             } else {
                 Some(py_selector_to_transaction(py, &selector_obj)?)
             };
             let selector_ref = operation
-                .getattr("selector_ref")?
+                .getattr(intern!(py, "selector_ref"))?
+                .extract::<Option<String>>()?;
+            let content = operation
+                .getattr(intern!(py, "content"))?
                 .extract::<Option<String>>()?;
-            let content = operation.getattr("content")?.extract::<Option<String>>()?;
-            let position_obj = operation.getattr("position")?;
+            let position_obj = operation.getattr(intern!(py, "position"))?;
             let position = py_insert_position_to_rust(&position_obj)?;
             Ok(TxOperation::Insert(TxInsertOperation {
                 selector,
@@ -385,24 +515,26 @@ fn py_operation_to_rust(py: Python<'_>, operation: &Bound<'_, PyAny>) -> PyResul
             }))
         }
         "ReplaceOperation" => {
-            let selector_obj = operation.getattr("selector")?;
+            let selector_obj = operation.getattr(intern!(py, "selector"))?;
             let selector = if selector_obj.is_none() {
                 None
             } else {
                 Some(py_selector_to_transaction(py, &selector_obj)?)
             };
             let selector_ref = operation
-                .getattr("selector_ref")?
+                .getattr(intern!(py, "selector_ref"))?
+                .extract::<Option<String>>()?;
+            let content = operation
+                .getattr(intern!(py, "content"))?
                 .extract::<Option<String>>()?;
-            let content = operation.getattr("content")?.extract::<Option<String>>()?;
-            let until_obj = operation.getattr("until")?;
+            let until_obj = operation.getattr(intern!(py, "until"))?;
             let until = if until_obj.is_none() {
                 None
             } else {
                 Some(py_selector_to_transaction(py, &until_obj)?)
             };
             let until_ref = operation
-                .getattr("until_ref")?
+                .getattr(intern!(py, "until_ref"))?
                 .extract::<Option<String>>()?;
             Ok(TxOperation::Replace(TxReplaceOperation {
                 selector,
@@ -415,24 +547,26 @@ fn py_operation_to_rust(py: Python<'_>, operation: &Bound<'_, PyAny>) -> PyResul
             }))
         }
         "DeleteOperation" => {
-            let selector_obj = operation.getattr("selector")?;
+            let selector_obj = operation.getattr(intern!(py, "selector"))?;
             let selector = if selector_obj.is_none() {
                 None
             } else {
                 Some(py_selector_to_transaction(py, &selector_obj)?)
             };
             let selector_ref = operation
-                .getattr("selector_ref")?
+                .getattr(intern!(py, "selector_ref"))?
                 .extract::<Option<String>>()?;
-            let section = operation.getattr("section")?.extract::<bool>()?;
-            let until_obj = operation.getattr("until")?;
+            let section = operation
+                .getattr(intern!(py, "section"))?
+                .extract::<bool>()?;
+            let until_obj = operation.getattr(intern!(py, "until"))?;
             let until = if until_obj.is_none() {
                 None
             } else {
                 Some(py_selector_to_transaction(py, &until_obj)?)
             };
             let until_ref = operation
-                .getattr("until_ref")?
+                .getattr(intern!(py, "until_ref"))?
                 .extract::<Option<String>>()?;
             Ok(TxOperation::Delete(TxDeleteOperation {
                 selector,
@@ -444,10 +578,10 @@ fn py_operation_to_rust(py: Python<'_>, operation: &Bound<'_, PyAny>) -> PyResul
             }))
         }
         "SetFrontmatterOperation" => {
-            let key: String = operation.getattr("key")?.extract()?;
-            let value_obj = operation.getattr("value")?;
+            let key: String = operation.getattr(intern!(py, "key"))?.extract()?;
+            let value_obj = operation.getattr(intern!(py, "value"))?;
             let value = Some(py_to_yaml_value(py, &value_obj)?);
-            let format_obj = operation.getattr("format")?;
+            let format_obj = operation.getattr(intern!(py, "format"))?;
             let format = if format_obj.is_none() {
                 None
             } else {
@@ -462,15 +596,15 @@ fn py_operation_to_rust(py: Python<'_>, operation: &Bound<'_, PyAny>) -> PyResul
             }))
         }
         "DeleteFrontmatterOperation" => {
-            let key: String = operation.getattr("key")?.extract()?;
+            let key: String = operation.getattr(intern!(py, "key"))?.extract()?;
             Ok(TxOperation::DeleteFrontmatter(
                 TxDeleteFrontmatterOperation { key, comment: None },
             ))
         }
         "ReplaceFrontmatterOperation" => {
-            let content_obj = operation.getattr("content")?;
+            let content_obj = operation.getattr(intern!(py, "content"))?;
             let content = Some(py_to_yaml_value(py, &content_obj)?);
-            let format_obj = operation.getattr("format")?;
+            let format_obj = operation.getattr(intern!(py, "format"))?;
             let format = if format_obj.is_none() {
                 None
             } else {
@@ -492,35 +626,41 @@ fn py_operation_to_rust(py: Python<'_>, operation: &Bound<'_, PyAny>) -> PyResul
 }
 
 fn py_selector_to_transaction(py: Python<'_>, selector: &Bound<'_, PyAny>) -> PyResult<TxSelector> {
-    let alias = selector.getattr("alias")?.extract::<Option<String>>()?;
+    let alias = selector
+        .getattr(intern!(py, "alias"))?
+        .extract::<Option<String>>()?;
     let select_type = selector
-        .getattr("select_type")?
+        .getattr(intern!(py, "select_type"))?
         .extract::<Option<String>>()?;
     let select_contains = selector
-        .getattr("select_contains")?
+        .getattr(intern!(py, "select_contains"))?
         .extract::<Option<String>>()?;
-    let select_regex_obj = selector.getattr("select_regex")?;
+    let select_regex_obj = selector.getattr(intern!(py, "select_regex"))?;
     let select_regex = if select_regex_obj.is_none() {
         None
     } else {
         Some(extract_regex_pattern(&select_regex_obj)?)
     };
-    let select_ordinal = selector.getattr("select_ordinal")?.extract::<usize>()?;
-    let after_obj = selector.getattr("after")?;
+    let select_ordinal = selector
+        .getattr(intern!(py, "select_ordinal"))?
+        .extract::<usize>()?;
+    let after_obj = selector.getattr(intern!(py, "after"))?;
     let after = if after_obj.is_none() {
         None
     } else {
         Some(Box::new(py_selector_to_transaction(py, &after_obj)?))
     };
-    let after_ref = selector.getattr("after_ref")?.extract::<Option<String>>()?;
-    let within_obj = selector.getattr("within")?;
+    let after_ref = selector
+        .getattr(intern!(py, "after_ref"))?
+        .extract::<Option<String>>()?;
+    let within_obj = selector.getattr(intern!(py, "within"))?;
     let within = if within_obj.is_none() {
         None
     } else {
         Some(Box::new(py_selector_to_transaction(py, &within_obj)?))
     };
     let within_ref = selector
-        .getattr("within_ref")?
+        .getattr(intern!(py, "within_ref"))?
         .extract::<Option<String>>()?;
 
     Ok(TxSelector {
@@ -537,19 +677,18 @@ fn py_selector_to_transaction(py: Python<'_>, selector: &Bound<'_, PyAny>) -> Py
 }
 
 fn py_insert_position_to_rust(position: &Bound<'_, PyAny>) -> PyResult<TxInsertPosition> {
-    let value: String = if let Ok(val) = position.getattr("value") {
+    let py = position.py();
+    let value: String = if let Ok(val) = position.getattr(intern!(py, "value")) {
         val.extract()?
     } else {
         position.extract()?
     };
 
-    let normalized = value.replace('-', "_");
-
-    match normalized.as_str() {
+    match value.as_str() {
         "before" => Ok(TxInsertPosition::Before),
         "after" => Ok(TxInsertPosition::After),
-        "prepend_child" => Ok(TxInsertPosition::PrependChild),
-        "append_child" => Ok(TxInsertPosition::AppendChild),
+        "prepend_child" | "prepend-child" => Ok(TxInsertPosition::PrependChild),
+        "append_child" | "append-child" => Ok(TxInsertPosition::AppendChild),
         _ => Err(PyValueError::new_err(format!(
             "Unsupported insert position: {value}"
         ))),
@@ -557,9 +696,10 @@ fn py_insert_position_to_rust(position: &Bound<'_, PyAny>) -> PyResult<TxInsertP
 }
 
 fn py_frontmatter_format_to_rust(format_obj: &Bound<'_, PyAny>) -> PyResult<FrontmatterFormat> {
-    let value: String = if let Ok(val) = format_obj.getattr("name") {
+    let py = format_obj.py();
+    let value: String = if let Ok(val) = format_obj.getattr(intern!(py, "name")) {
         val.extract()?
-    } else if let Ok(val) = format_obj.getattr("value") {
+    } else if let Ok(val) = format_obj.getattr(intern!(py, "value")) {
         val.extract::<String>()?
     } else {
         format_obj.extract()?
@@ -680,25 +820,27 @@ fn py_selector_to_locator(
     selector: &Bound<'_, PyAny>,
 ) -> PyResult<LocatorSelector> {
     let select_type = selector
-        .getattr("select_type")?
+        .getattr(intern!(py, "select_type"))?
         .extract::<Option<String>>()?;
     let select_contains = selector
-        .getattr("select_contains")?
+        .getattr(intern!(py, "select_contains"))?
         .extract::<Option<String>>()?;
-    let select_regex_obj = selector.getattr("select_regex")?;
+    let select_regex_obj = selector.getattr(intern!(py, "select_regex"))?;
     let select_regex = if select_regex_obj.is_none() {
         None
     } else {
         Some(python_regex_to_rust(py, &select_regex_obj)?)
     };
-    let select_ordinal = selector.getattr("select_ordinal")?.extract::<usize>()?;
-    let after_obj = selector.getattr("after")?;
+    let select_ordinal = selector
+        .getattr(intern!(py, "select_ordinal"))?
+        .extract::<usize>()?;
+    let after_obj = selector.getattr(intern!(py, "after"))?;
     let after = if after_obj.is_none() {
         None
     } else {
         Some(Box::new(py_selector_to_locator(py, &after_obj)?))
     };
-    let within_obj = selector.getattr("within")?;
+    let within_obj = selector.getattr(intern!(py, "within"))?;
     let within = if within_obj.is_none() {
         None
     } else {
@@ -715,24 +857,49 @@ fn py_selector_to_locator(
     })
 }
 
+/// Cache of compiled selector regexes keyed by pattern and flag bits. Regex
+/// clones share their compiled program via Arc, so a hit is a refcount bump
+/// while a miss pays the full NFA compilation once per distinct pattern.
+const REGEX_CACHE_CAPACITY: usize = 256;
+
+static REGEX_CACHE: OnceLock<Mutex<HashMap<(String, u8), Regex>>> = OnceLock::new();
+
 fn python_regex_to_rust(py: Python<'_>, pattern_obj: &Bound<'_, PyAny>) -> PyResult<Regex> {
     let pattern = extract_regex_pattern(pattern_obj)?;
     let flags = extract_regex_flags(py, pattern_obj)?;
+    let flag_bits =
+        (flags.ignore_case as u8) | ((flags.multi_line as u8) << 1) | ((flags.dot_all as u8) << 2);
+
+    let cache = REGEX_CACHE.get_or_init(|| Mutex::new(HashMap::new()));
+    let key = (pattern, flag_bits);
+    if let Ok(guard) = cache.lock() {
+        if let Some(regex) = guard.get(&key) {
+            return Ok(regex.clone());
+        }
+    }
 
-    let mut builder = RegexBuilder::new(&pattern);
+    let mut builder = RegexBuilder::new(&key.0);
     builder.case_insensitive(flags.ignore_case);
     builder.multi_line(flags.multi_line);
     builder.dot_matches_new_line(flags.dot_all);
     builder.unicode(true);
 
-    builder
+    let regex = builder
         .build()
-        .map_err(|err| invalid_regex_pyerr(py, err.to_string()))
+        .map_err(|err| invalid_regex_pyerr(py, err.to_string()))?;
+
+    if let Ok(mut guard) = cache.lock() {
+        if guard.len() >= REGEX_CACHE_CAPACITY {
+            guard.clear();
+        }
+        guard.insert(key, regex.clone());
+    }
+    Ok(regex)
 }
 
 fn invalid_regex_pyerr(py: Python<'_>, message: String) -> PyErr {
     if let Ok(errors_module) = py.import("md_splice.errors") {
-        if let Ok(obj) = errors_module.getattr("InvalidRegexError") {
+        if let Ok(obj) = errors_module.getattr(intern!(py, "InvalidRegexError")) {
             if let Ok(error_type) = obj.cast_into::<PyType>() {
                 return PyErr::from_type(error_type, (message,));
             }
@@ -743,7 +910,8 @@ fn invalid_regex_pyerr(py: Python<'_>, message: String) -> PyErr {
 }
 
 fn extract_regex_pattern(pattern_obj: &Bound<'_, PyAny>) -> PyResult<String> {
-    if let Ok(pattern_attr) = pattern_obj.getattr("pattern") {
+    let py = pattern_obj.py();
+    if let Ok(pattern_attr) = pattern_obj.getattr(intern!(py, "pattern")) {
         pattern_attr.extract::<String>()
     } else {
         pattern_obj.extract::<String>()
@@ -762,24 +930,46 @@ fn extract_regex_flags(py: Python<'_>, pattern_obj: &Bound<'_, PyAny>) -> PyResu
         return Ok(RegexFlags::default());
     }
 
-    let flags_value = pattern_obj.getattr("flags")?.extract::<u32>()?;
+    let flags_value = pattern_obj
+        .getattr(intern!(py, "flags"))?
+        .extract::<u32>()?;
     if flags_value == 0 {
         return Ok(RegexFlags::default());
     }
 
     let re_module = py.import("re")?;
-    let flag_ignorecase = re_module.getattr("IGNORECASE")?.extract::<u32>()?;
-    let flag_multiline = re_module.getattr("MULTILINE")?.extract::<u32>()?;
-    let flag_dotall = re_module.getattr("DOTALL")?.extract::<u32>()?;
-    let flag_unicode = re_module.getattr("UNICODE")?.extract::<u32>()?;
+    let flag_ignorecase = re_module
+        .getattr(intern!(py, "IGNORECASE"))?
+        .extract::<u32>()?;
+    let flag_multiline = re_module
+        .getattr(intern!(py, "MULTILINE"))?
+        .extract::<u32>()?;
+    let flag_dotall = re_module.getattr(intern!(py, "DOTALL"))?.extract::<u32>()?;
+    let flag_unicode = re_module
+        .getattr(intern!(py, "UNICODE"))?
+        .extract::<u32>()?;
 
     let supported_mask = flag_ignorecase | flag_multiline | flag_dotall | flag_unicode;
 
     let known_unsupported = [
-        ("VERBOSE", re_module.getattr("VERBOSE")?.extract::<u32>()?),
-        ("ASCII", re_module.getattr("ASCII")?.extract::<u32>()?),
-        ("LOCALE", re_module.getattr("LOCALE")?.extract::<u32>()?),
-        ("DEBUG", re_module.getattr("DEBUG")?.extract::<u32>()?),
+        (
+            "VERBOSE",
+            re_module
+                .getattr(intern!(py, "VERBOSE"))?
+                .extract::<u32>()?,
+        ),
+        (
+            "ASCII",
+            re_module.getattr(intern!(py, "ASCII"))?.extract::<u32>()?,
+        ),
+        (
+            "LOCALE",
+            re_module.getattr(intern!(py, "LOCALE"))?.extract::<u32>()?,
+        ),
+        (
+            "DEBUG",
+            re_module.getattr(intern!(py, "DEBUG"))?.extract::<u32>()?,
+        ),
     ];
 
     let mut unsupported: Vec<String> = Vec::new();
@@ -909,6 +1099,29 @@ fn diff_unified(before: &str, after: &str, fromfile: &str, tofile: &str) -> PyRe
     Ok(diff)
 }
 
+/// Produce a unified diff between an on-disk file and a document's render.
+///
+/// The file is read and the document rendered entirely on the Rust side, so
+/// neither full text is materialized as a Python string. The optional
+/// ``fromfile`` and ``tofile`` labels appear in the diff header.
+#[pyfunction]
+#[pyo3(signature = (path, doc, *, fromfile="original", tofile="modified"))]
+fn diff_unified_from_file(
+    path: &Bound<'_, PyAny>,
+    doc: &PyMarkdownDocument,
+    fromfile: &str,
+    tofile: &str,
+) -> PyResult<String> {
+    let path_buf: PathBuf = path.extract()?;
+    let before = fs::read_to_string(&path_buf).map_err(map_io_error)?;
+    let after = doc.inner.render();
+    let diff = TextDiff::from_lines(before.as_str(), after.as_str())
+        .unified_diff()
+        .header(fromfile, tofile)
+        .to_string();
+    Ok(diff)
+}
+
 /// Parse YAML or JSON operation definitions into Python dataclasses.
 ///
 /// The ``format`` parameter can force ``"yaml"`` or ``"json"``. When omitted
@@ -945,25 +1158,24 @@ fn dumps_operations(
         .map(tx_operation_to_yaml_value)
         .collect::<Result<Vec<_>, _>>()
         .map_err(map_splice_error)?;
-    let normalized = format.to_ascii_lowercase();
-
-    match normalized.as_str() {
-        "yaml" => serde_yaml::to_string(&yaml_operations)
-            .map_err(|err| map_splice_error(SpliceError::OperationParse(err.to_string()))),
-        "json" => serde_json::to_string_pretty(&yaml_operations)
-            .map_err(|err| map_splice_error(SpliceError::OperationParse(err.to_string()))),
-        other => Err(PyValueError::new_err(format!(
-            "Unsupported operations format: {other}"
-        ))),
+    if format.eq_ignore_ascii_case("yaml") {
+        serde_yaml::to_string(&yaml_operations)
+            .map_err(|err| map_splice_error(SpliceError::OperationParse(err.to_string())))
+    } else if format.eq_ignore_ascii_case("json") {
+        serde_json::to_string_pretty(&yaml_operations)
+            .map_err(|err| map_splice_error(SpliceError::OperationParse(err.to_string())))
+    } else {
+        Err(PyValueError::new_err(format!(
+            "Unsupported operations format: {format}"
+        )))
     }
 }
 
 fn parse_operations(text: &str, format: Option<&str>) -> Result<Vec<TxOperation>, SpliceError> {
-    let normalized = format.map(|value| value.to_ascii_lowercase());
-    match normalized.as_deref() {
-        Some("yaml") => serde_yaml::from_str(text)
+    match format {
+        Some(value) if value.eq_ignore_ascii_case("yaml") => serde_yaml::from_str(text)
             .map_err(|err| SpliceError::OperationParse(err.to_string())),
-        Some("json") => serde_json::from_str(text)
+        Some(value) if value.eq_ignore_ascii_case("json") => serde_json::from_str(text)
             .map_err(|err| SpliceError::OperationParse(err.to_string())),
         Some(other) => Err(SpliceError::OperationParse(format!(
             "Unsupported operations format: {other}"
@@ -992,21 +1204,21 @@ fn tx_operation_to_py(
                 .map_err(map_splice_error)?;
 
             let class = types_module
-                .getattr("InsertOperation")?
+                .getattr(intern!(py, "InsertOperation"))?
                 .cast_into::<PyType>()?;
             let kwargs = PyDict::new(py);
             if let Some(selector) = &op.selector {
                 let selector_value = tx_selector_to_py(py, types_module, selector)?;
-                kwargs.set_item("selector", selector_value)?;
+                kwargs.set_item(intern!(py, "selector"), selector_value)?;
             }
             if let Some(selector_ref) = &op.selector_ref {
-                kwargs.set_item("selector_ref", selector_ref)?;
+                kwargs.set_item(intern!(py, "selector_ref"), selector_ref)?;
             }
             if let Some(content) = &op.content {
-                kwargs.set_item("content", content)?;
+                kwargs.set_item(intern!(py, "content"), content)?;
             }
             let position = insert_position_to_py(py, types_module, op.position)?;
-            kwargs.set_item("position", position)?;
+            kwargs.set_item(intern!(py, "position"), position)?;
             let instance = class.call((), Some(&kwargs))?;
             Ok(instance.into_any().unbind())
         }
@@ -1017,25 +1229,25 @@ fn tx_operation_to_py(
                 .map_err(map_splice_error)?;
 
             let class = types_module
-                .getattr("ReplaceOperation")?
+                .getattr(intern!(py, "ReplaceOperation"))?
                 .cast_into::<PyType>()?;
             let kwargs = PyDict::new(py);
             if let Some(selector) = &op.selector {
                 let selector_value = tx_selector_to_py(py, types_module, selector)?;
-                kwargs.set_item("selector", selector_value)?;
+                kwargs.set_item(intern!(py, "selector"), selector_value)?;
             }
             if let Some(selector_ref) = &op.selector_ref {
-                kwargs.set_item("selector_ref", selector_ref)?;
+                kwargs.set_item(intern!(py, "selector_ref"), selector_ref)?;
             }
             if let Some(content) = &op.content {
-                kwargs.set_item("content", content)?;
+                kwargs.set_item(intern!(py, "content"), content)?;
             }
             if let Some(until) = &op.until {
                 let until_selector = tx_selector_to_py(py, types_module, until)?;
-                kwargs.set_item("until", until_selector)?;
+                kwargs.set_item(intern!(py, "until"), until_selector)?;
             }
             if let Some(until_ref) = &op.until_ref {
-                kwargs.set_item("until_ref", until_ref)?;
+                kwargs.set_item(intern!(py, "until_ref"), until_ref)?;
             }
             let instance = class.call((), Some(&kwargs))?;
             Ok(instance.into_any().unbind())
@@ -1045,23 +1257,23 @@ fn tx_operation_to_py(
                 .map_err(map_splice_error)?;
 
             let class = types_module
-                .getattr("DeleteOperation")?
+                .getattr(intern!(py, "DeleteOperation"))?
                 .cast_into::<PyType>()?;
             let kwargs = PyDict::new(py);
             if let Some(selector) = &op.selector {
                 let selector_value = tx_selector_to_py(py, types_module, selector)?;
-                kwargs.set_item("selector", selector_value)?;
+                kwargs.set_item(intern!(py, "selector"), selector_value)?;
             }
             if let Some(selector_ref) = &op.selector_ref {
-                kwargs.set_item("selector_ref", selector_ref)?;
+                kwargs.set_item(intern!(py, "selector_ref"), selector_ref)?;
             }
-            kwargs.set_item("section", op.section)?;
+            kwargs.set_item(intern!(py, "section"), op.section)?;
             if let Some(until) = &op.until {
                 let until_selector = tx_selector_to_py(py, types_module, until)?;
-                kwargs.set_item("until", until_selector)?;
+                kwargs.set_item(intern!(py, "until"), until_selector)?;
             }
             if let Some(until_ref) = &op.until_ref {
-                kwargs.set_item("until_ref", until_ref)?;
+                kwargs.set_item(intern!(py, "until_ref"), until_ref)?;
             }
             let instance = class.call((), Some(&kwargs))?;
             Ok(instance.into_any().unbind())
@@ -1073,18 +1285,18 @@ fn tx_operation_to_py(
                 .map_err(map_splice_error)?;
 
             let class = types_module
-                .getattr("SetFrontmatterOperation")?
+                .getattr(intern!(py, "SetFrontmatterOperation"))?
                 .cast_into::<PyType>()?;
             let kwargs = PyDict::new(py);
-            kwargs.set_item("key", &op.key)?;
+            kwargs.set_item(intern!(py, "key"), &op.key)?;
             let value = match &op.value {
                 Some(value) => yaml_value_to_py(py, value)?,
                 None => py.None(),
             };
-            kwargs.set_item("value", value)?;
+            kwargs.set_item(intern!(py, "value"), value)?;
             if let Some(format) = op.format {
                 let format_value = frontmatter_format_to_py(py, types_module, format)?;
-                kwargs.set_item("format", format_value)?;
+                kwargs.set_item(intern!(py, "format"), format_value)?;
             }
             let instance = class.call((), Some(&kwargs))?;
             Ok(instance.into_any().unbind())
@@ -1094,10 +1306,10 @@ fn tx_operation_to_py(
                 .map_err(map_splice_error)?;
 
             let class = types_module
-                .getattr("DeleteFrontmatterOperation")?
+                .getattr(intern!(py, "DeleteFrontmatterOperation"))?
                 .cast_into::<PyType>()?;
             let kwargs = PyDict::new(py);
-            kwargs.set_item("key", &op.key)?;
+            kwargs.set_item(intern!(py, "key"), &op.key)?;
             let instance = class.call((), Some(&kwargs))?;
             Ok(instance.into_any().unbind())
         }
@@ -1108,17 +1320,17 @@ fn tx_operation_to_py(
                 .map_err(map_splice_error)?;
 
             let class = types_module
-                .getattr("ReplaceFrontmatterOperation")?
+                .getattr(intern!(py, "ReplaceFrontmatterOperation"))?
                 .cast_into::<PyType>()?;
             let kwargs = PyDict::new(py);
             let content = match &op.content {
                 Some(value) => yaml_value_to_py(py, value)?,
                 None => py.None(),
             };
-            kwargs.set_item("content", content)?;
+            kwargs.set_item(intern!(py, "content"), content)?;
             if let Some(format) = op.format {
                 let format_value = frontmatter_format_to_py(py, types_module, format)?;
-                kwargs.set_item("format", format_value)?;
+                kwargs.set_item(intern!(py, "format"), format_value)?;
             }
             let instance = class.call((), Some(&kwargs))?;
             Ok(instance.into_any().unbind())
@@ -1361,37 +1573,39 @@ fn tx_selector_to_py(
     types_module: &Bound<'_, PyModule>,
     selector: &TxSelector,
 ) -> PyResult<Py<PyAny>> {
-    let class = types_module.getattr("Selector")?.cast_into::<PyType>()?;
+    let class = types_module
+        .getattr(intern!(py, "Selector"))?
+        .cast_into::<PyType>()?;
     let kwargs = PyDict::new(py);
 
     if let Some(alias) = &selector.alias {
-        kwargs.set_item("alias", alias)?;
+        kwargs.set_item(intern!(py, "alias"), alias)?;
     }
     if let Some(select_type) = &selector.select_type {
-        kwargs.set_item("select_type", select_type)?;
+        kwargs.set_item(intern!(py, "select_type"), select_type)?;
     }
     if let Some(select_contains) = &selector.select_contains {
-        kwargs.set_item("select_contains", select_contains)?;
+        kwargs.set_item(intern!(py, "select_contains"), select_contains)?;
     }
     if let Some(select_regex) = &selector.select_regex {
-        kwargs.set_item("select_regex", select_regex)?;
+        kwargs.set_item(intern!(py, "select_regex"), select_regex)?;
     }
     if selector.select_ordinal != 1 {
-        kwargs.set_item("select_ordinal", selector.select_ordinal)?;
+        kwargs.set_item(intern!(py, "select_ordinal"), selector.select_ordinal)?;
     }
     if let Some(after) = &selector.after {
         let nested = tx_selector_to_py(py, types_module, after)?;
-        kwargs.set_item("after", nested)?;
+        kwargs.set_item(intern!(py, "after"), nested)?;
     }
     if let Some(after_ref) = &selector.after_ref {
-        kwargs.set_item("after_ref", after_ref)?;
+        kwargs.set_item(intern!(py, "after_ref"), after_ref)?;
     }
     if let Some(within) = &selector.within {
         let nested = tx_selector_to_py(py, types_module, within)?;
-        kwargs.set_item("within", nested)?;
+        kwargs.set_item(intern!(py, "within"), nested)?;
     }
     if let Some(within_ref) = &selector.within_ref {
-        kwargs.set_item("within_ref", within_ref)?;
+        kwargs.set_item(intern!(py, "within_ref"), within_ref)?;
     }
 
     let instance = class.call((), Some(&kwargs))?;
@@ -1399,11 +1613,11 @@ fn tx_selector_to_py(
 }
 
 fn insert_position_to_py(
-    _py: Python<'_>,
+    py: Python<'_>,
     types_module: &Bound<'_, PyModule>,
     position: TxInsertPosition,
 ) -> PyResult<Py<PyAny>> {
-    let enum_class = types_module.getattr("InsertPosition")?;
+    let enum_class = types_module.getattr(intern!(py, "InsertPosition"))?;
     let variant_name = match position {
         TxInsertPosition::Before => "BEFORE",
         TxInsertPosition::After => "AFTER",
@@ -1423,11 +1637,11 @@ fn insert_position_to_str(position: TxInsertPosition) -> &'static str {
 }
 
 fn frontmatter_format_to_py(
-    _py: Python<'_>,
+    py: Python<'_>,
     types_module: &Bound<'_, PyModule>,
     format: FrontmatterFormat,
 ) -> PyResult<Py<PyAny>> {
-    let enum_class = types_module.getattr("FrontmatterFormat")?;
+    let enum_class = types_module.getattr(intern!(py, "FrontmatterFormat"))?;
     let variant_name = match format {
         FrontmatterFormat::Yaml => "YAML",
         FrontmatterFormat::Toml => "TOML",
@@ -1460,6 +1674,19 @@ fn unsupported_operation_field(field: &str) -> SpliceError {
     ))
 }
 
+/// Whether writing `rendered` would leave the file effectively unchanged.
+///
+/// The printer drops the source's final newline, so nearly every real file
+/// renders one byte shorter than it was loaded; treating that lone trailing
+/// newline as equal keeps no-op sessions from rewriting the file just to
+/// strip it.
+fn rendered_matches_source(rendered: &str, source: &str) -> bool {
+    if rendered.len() == source.len() {
+        return rendered == source;
+    }
+    source.strip_suffix('\n') == Some(rendered)
+}
+
 fn create_backup(path: &Path) -> PyResult<PathBuf> {
     if !path.exists() {
         return Err(map_splice_error(SpliceError::Io(format!(
@@ -1472,7 +1699,18 @@ fn create_backup(path: &Path) -> PyResult<PathBuf> {
     backup_name.push("~");
     let backup_path = PathBuf::from(backup_name);
 
-    fs::copy(path, &backup_path).map_err(|err| map_io_error(err))?;
+    // Hard-link the current file as the backup: O(1) metadata work instead
+    // of copying the document. The subsequent atomic rename replaces `path`
+    // with a new inode, so the link keeps the original bytes frozen. Fall
+    // back to a copy where links are unsupported (e.g. some network mounts).
+    match fs::remove_file(&backup_path) {
+        Ok(()) => {}
+        Err(err) if err.kind() == io::ErrorKind::NotFound => {}
+        Err(err) => return Err(map_io_error(err)),
+    }
+    if fs::hard_link(path, &backup_path).is_err() {
+        fs::copy(path, &backup_path).map_err(|err| map_io_error(err))?;
+    }
     Ok(backup_path)
 }
 
@@ -1488,10 +1726,12 @@ fn write_atomic(path: &Path, content: &str) -> PyResult<()> {
         .tempfile_in(parent)
         .map_err(|err| map_io_error(io::Error::new(io::ErrorKind::Other, err.to_string())))?;
 
+    // NamedTempFile writes through an unbuffered File handle, so the full
+    // document goes to the kernel in a single write syscall; File::flush is
+    // a no-op and is deliberately omitted.
     temp_file
         .write_all(content.as_bytes())
         .map_err(|err| map_io_error(err))?;
-    temp_file.flush().map_err(|err| map_io_error(err))?;
     temp_file
         .persist(path)
         .map_err(|err| map_io_error(err.error))?;
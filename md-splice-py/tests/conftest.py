@@ -0,0 +1,37 @@
+"""Shared pytest configuration for the md-splice binding tests."""
+
+from __future__ import annotations
+
+import os
+
+from hypothesis import HealthCheck, settings
+
+# Default profile for local runs and CI: the property tests exercise the same
+# parse/apply/render pipeline on every example, so 25 examples cover the
+# behavior at a quarter of the default wall time; deadlines are disabled so a
+# cold Rust-extension import cannot flake the first example. Export
+# HYPOTHESIS_PROFILE to select another registered profile (e.g. "thorough").
+settings.register_profile(
+    "ci",
+    max_examples=25,
+    deadline=None,
+    suppress_health_check=[HealthCheck.too_slow],
+)
+settings.register_profile("thorough", max_examples=200, deadline=None)
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "ci"))
+
+
+def pytest_collection_modifyitems(config, items) -> None:
+    """Drop duplicate test node IDs from the collection.
+
+    Guards against the same test module being collected twice (e.g. via a
+    stray packaging copy or overlapping rootdir configuration), which would
+    silently double the suite's runtime.
+    """
+    seen: set[str] = set()
+    unique = []
+    for item in items:
+        if item.nodeid not in seen:
+            seen.add(item.nodeid)
+            unique.append(item)
+    items[:] = unique
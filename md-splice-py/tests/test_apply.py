@@ -26,16 +26,89 @@ from md_splice.errors import (
 )
 
 
-def test_apply_insert_and_render_updates_document() -> None:
-    doc = MarkdownDocument.from_string(
-        dedent(
-            """
-            # Tasks
+_TASKS_DOC = dedent(
+    """
+    # Tasks
 
-            - [ ] Write documentation
-            """
-        ).lstrip()
-    )
+    - [ ] Write documentation
+    """
+).lstrip()
+
+_LOREM_SECTIONS_DOC = dedent(
+    """
+    # Lorem
+
+    ## Changelog
+    Ipsum
+
+    ## Dolor
+    Sit amet
+    """
+).lstrip()
+
+_ALPHA_BETA_DOC = dedent(
+    """
+    ## Alpha
+
+    First paragraph.
+
+    Second paragraph.
+
+    ## Beta
+
+    Tail text.
+    """
+).lstrip()
+
+_NESTED_SECTIONS_DOC = dedent(
+    """
+    ## Alpha
+
+    Context
+
+    ### Nested
+
+    Details
+
+    ## Beta
+    """
+).lstrip()
+
+_FRONTMATTER_DOC = dedent(
+    """
+    ---
+    title: Sample
+    reviewers: []
+    ---
+
+    Body
+    """
+).lstrip()
+
+_PROJECT_LOG_DOC = dedent(
+    """
+    # Project Log
+
+    ## Overview
+    Summary.
+
+    ## Changelog
+    - Legacy entry
+    """
+).lstrip()
+
+_NOTES_OVERVIEW_DOC = dedent(
+    """
+    # Notes
+
+    ## Overview
+    Details.
+    """
+).lstrip()
+
+
+def test_apply_insert_and_render_updates_document() -> None:
+    doc = MarkdownDocument.from_string(_TASKS_DOC)
 
     doc.apply(
         [
@@ -55,19 +128,7 @@ def test_apply_insert_and_render_updates_document() -> None:
 
 
 def test_apply_insert_preserves_list_marker_spacing() -> None:
-    doc = MarkdownDocument.from_string(
-        dedent(
-            """
-            # Lorem
-
-            ## Changelog
-            Ipsum
-
-            ## Dolor
-            Sit amet
-            """
-        ).lstrip()
-    )
+    doc = MarkdownDocument.from_string(_LOREM_SECTIONS_DOC)
 
     doc.apply(
         [
@@ -90,21 +151,7 @@ def test_apply_insert_preserves_list_marker_spacing() -> None:
 
 
 def test_apply_replace_until_range_substitutes_multiple_blocks() -> None:
-    doc = MarkdownDocument.from_string(
-        dedent(
-            """
-            ## Alpha
-
-            First paragraph.
-
-            Second paragraph.
-
-            ## Beta
-
-            Tail text.
-            """
-        ).lstrip()
-    )
+    doc = MarkdownDocument.from_string(_ALPHA_BETA_DOC)
 
     doc.apply(
         [
@@ -122,21 +169,7 @@ def test_apply_replace_until_range_substitutes_multiple_blocks() -> None:
 
 
 def test_apply_delete_section_removes_heading_and_body() -> None:
-    doc = MarkdownDocument.from_string(
-        dedent(
-            """
-            ## Alpha
-
-            Context
-
-            ### Nested
-
-            Details
-
-            ## Beta
-            """
-        ).lstrip()
-    )
+    doc = MarkdownDocument.from_string(_NESTED_SECTIONS_DOC)
 
     doc.apply(
         [
@@ -183,18 +216,7 @@ def test_apply_warns_on_ambiguity() -> None:
 
 
 def test_apply_frontmatter_operations_modify_payload() -> None:
-    doc = MarkdownDocument.from_string(
-        dedent(
-            """
-            ---
-            title: Sample
-            reviewers: []
-            ---
-
-            Body
-            """
-        ).lstrip()
-    )
+    doc = MarkdownDocument.from_string(_FRONTMATTER_DOC)
 
     doc.apply(
         [
@@ -260,19 +282,7 @@ def test_diff_unified_includes_custom_headers() -> None:
 
 
 def test_apply_supports_selector_alias_reuse() -> None:
-    doc = MarkdownDocument.from_string(
-        dedent(
-            """
-            # Project Log
-
-            ## Overview
-            Summary.
-
-            ## Changelog
-            - Legacy entry
-            """
-        ).lstrip()
-    )
+    doc = MarkdownDocument.from_string(_PROJECT_LOG_DOC)
 
     doc.apply(
         [
@@ -326,16 +336,7 @@ def test_apply_errors_on_missing_selector_alias() -> None:
 
 
 def test_apply_errors_on_duplicate_selector_alias() -> None:
-    doc = MarkdownDocument.from_string(
-        dedent(
-            """
-            # Notes
-
-            ## Overview
-            Details.
-            """
-        ).lstrip()
-    )
+    doc = MarkdownDocument.from_string(_NOTES_OVERVIEW_DOC)
 
     with pytest.raises(SelectorAliasAlreadyDefinedError):
         doc.apply(
@@ -359,3 +360,22 @@ def test_apply_errors_on_duplicate_selector_alias() -> None:
                 ),
             ]
         )
+
+
+def test_apply_serialized_yaml_operations() -> None:
+    doc = MarkdownDocument.from_string(_TASKS_DOC)
+
+    doc.apply_serialized(
+        dedent(
+            """
+            - op: insert
+              selector:
+                select_type: li
+                select_contains: Write documentation
+              position: after
+              content: "- [ ] Ship release"
+            """
+        )
+    )
+
+    assert "Ship release" in doc.render()
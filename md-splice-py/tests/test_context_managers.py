@@ -16,19 +16,19 @@ from md_splice.ctx import MdBatchEdit, MdEdit
 from md_splice.errors import OperationFailedError
 
 
-def _write_sample(path) -> None:
-    path.write_text(
-        dedent(
-            """
-            # Heading
+_SAMPLE_DOC = dedent(
+    """
+    # Heading
 
-            Paragraph one.
+    Paragraph one.
 
-            Paragraph two.
-            """
-        ).lstrip(),
-        encoding="utf-8",
-    )
+    Paragraph two.
+    """
+).lstrip()
+
+
+def _write_sample(path) -> None:
+    path.write_text(_SAMPLE_DOC, encoding="utf-8")
 
 
 def _make_replace_operation() -> ReplaceOperation:
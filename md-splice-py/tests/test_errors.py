@@ -3,9 +3,16 @@
 import pytest
 
 from md_splice import MarkdownDocument
-from md_splice.errors import FrontmatterParseError
+from md_splice.errors import AmbiguityWarning, FrontmatterParseError
 
 
 def test_frontmatter_parse_error_is_mapped():
     with pytest.raises(FrontmatterParseError):
         MarkdownDocument.from_string("---\ninvalid: [\n---\nbody\n")
+
+
+def test_ambiguity_warning_publicly_importable():
+    import md_splice
+
+    assert md_splice.AmbiguityWarning is AmbiguityWarning
+    assert issubclass(AmbiguityWarning, UserWarning)
@@ -15,16 +15,105 @@ from md_splice.errors import (
 )
 
 
+_INTRO_DOC = dedent(
+    """
+    Intro paragraph.
+
+    Another block.
+    """
+).lstrip()
+
+_TOKEN_DOC = dedent(
+    """
+    First paragraph.
+
+    Second paragraph with token.
+    """
+).lstrip()
+
+_ALPHA_SECTION_DOC = dedent(
+    """
+    ## Alpha
+
+    Prelude line.
+
+    ### Detail
+
+    Deep dive.
+
+    ## Beta
+
+    Tail text.
+    """
+).lstrip()
+
+_ALPHA_BETA_DOC = dedent(
+    """
+    ## Alpha
+
+    First paragraph.
+
+    Second paragraph.
+
+    ## Beta
+
+    Tail text.
+    """
+).lstrip()
+
+_LIST_PAIR_DOC = dedent(
+    """
+    - Alpha item
+    - Beta item
+    """
+).lstrip()
+
+_LIST_TRIO_DOC = dedent(
+    """
+    - Alpha
+    - Beta
+    - Gamma
+    """
+).lstrip()
+
+_BETA_TOKEN_DOC = dedent(
+    """
+    Paragraph One.
+
+    Another block with beta token.
+    """
+).lstrip()
+
+_CODE_ALPHA_BETA_DOC = dedent(
+    """
+    ```
+    Alpha
+    Beta
+    ```
+    """
+).lstrip()
+
+_CODE_ALPHA_GAMMA_DOC = dedent(
+    """
+    ```
+    Alpha
+    Gamma
+    ```
+    """
+).lstrip()
+
+
+@pytest.fixture(scope="module")
+def paragraph_doc() -> MarkdownDocument:
+    """Single-paragraph document shared by read-only tests.
+
+    ``get`` never mutates, so one parse serves every test in the module.
+    """
+    return MarkdownDocument.from_string("Paragraph.\n")
+
+
 def test_get_returns_single_block_by_contains():
-    doc = MarkdownDocument.from_string(
-        dedent(
-            """
-            Intro paragraph.
-
-            Another block.
-            """
-        ).lstrip()
-    )
+    doc = MarkdownDocument.from_string(_INTRO_DOC)
 
     result = doc.get(Selector(select_contains="Intro"))
 
@@ -32,15 +121,7 @@ def test_get_returns_single_block_by_contains():
 
 
 def test_get_supports_regex_filter():
-    doc = MarkdownDocument.from_string(
-        dedent(
-            """
-            First paragraph.
-
-            Second paragraph with token.
-            """
-        ).lstrip()
-    )
+    doc = MarkdownDocument.from_string(_TOKEN_DOC)
 
     result = doc.get(Selector(select_regex=r"token\.$"))
 
@@ -48,23 +129,7 @@ def test_get_supports_regex_filter():
 
 
 def test_get_section_returns_heading_and_descendants():
-    doc = MarkdownDocument.from_string(
-        dedent(
-            """
-            ## Alpha
-
-            Prelude line.
-
-            ### Detail
-
-            Deep dive.
-
-            ## Beta
-
-            Tail text.
-            """
-        ).lstrip()
-    )
+    doc = MarkdownDocument.from_string(_ALPHA_SECTION_DOC)
 
     result = doc.get(
         Selector(select_type="h2", select_contains="Alpha"),
@@ -82,21 +147,7 @@ def test_get_section_requires_heading():
 
 
 def test_get_with_until_extends_range_to_next_selector():
-    doc = MarkdownDocument.from_string(
-        dedent(
-            """
-            ## Alpha
-
-            First paragraph.
-
-            Second paragraph.
-
-            ## Beta
-
-            Tail text.
-            """
-        ).lstrip()
-    )
+    doc = MarkdownDocument.from_string(_ALPHA_BETA_DOC)
 
     result = doc.get(
         Selector(select_type="p", select_contains="First"),
@@ -107,14 +158,7 @@ def test_get_with_until_extends_range_to_next_selector():
 
 
 def test_get_until_disallows_list_items():
-    doc = MarkdownDocument.from_string(
-        dedent(
-            """
-            - Alpha item
-            - Beta item
-            """
-        ).lstrip()
-    )
+    doc = MarkdownDocument.from_string(_LIST_PAIR_DOC)
 
     with pytest.raises(RangeRequiresBlockError):
         doc.get(
@@ -124,50 +168,30 @@ def test_get_until_disallows_list_items():
 
 
 def test_get_select_all_returns_all_matches():
-    doc = MarkdownDocument.from_string(
-        dedent(
-            """
-            - Alpha
-            - Beta
-            - Gamma
-            """
-        ).lstrip()
-    )
+    doc = MarkdownDocument.from_string(_LIST_TRIO_DOC)
 
     result = doc.get(Selector(select_type="li"), select_all=True)
 
     assert result == ["- Alpha\n", "- Beta\n", "- Gamma\n"]
 
 
-def test_get_select_all_disallows_until():
-    doc = MarkdownDocument.from_string("Paragraph.\n")
-
+def test_get_select_all_disallows_until(paragraph_doc):
     with pytest.raises(ValueError):
-        doc.get(
+        paragraph_doc.get(
             Selector(select_type="p"),
             select_all=True,
             until=Selector(select_type="p", select_contains="Paragraph"),
         )
 
 
-def test_get_select_all_returns_empty_list_when_no_matches():
-    doc = MarkdownDocument.from_string("Paragraph.\n")
-
-    result = doc.get(Selector(select_type="h2"), select_all=True)
+def test_get_select_all_returns_empty_list_when_no_matches(paragraph_doc):
+    result = paragraph_doc.get(Selector(select_type="h2"), select_all=True)
 
     assert result == []
 
 
 def test_get_respects_regex_ignore_case_flag():
-    doc = MarkdownDocument.from_string(
-        dedent(
-            """
-            Paragraph One.
-
-            Another block with beta token.
-            """
-        ).lstrip()
-    )
+    doc = MarkdownDocument.from_string(_BETA_TOKEN_DOC)
 
     pattern = re.compile(r"beta", re.IGNORECASE)
     result = doc.get(Selector(select_type="p", select_regex=pattern))
@@ -176,16 +200,7 @@ def test_get_respects_regex_ignore_case_flag():
 
 
 def test_get_respects_regex_multiline_flag():
-    doc = MarkdownDocument.from_string(
-        dedent(
-            """
-            ```
-            Alpha
-            Beta
-            ```
-            """
-        ).lstrip()
-    )
+    doc = MarkdownDocument.from_string(_CODE_ALPHA_BETA_DOC)
 
     pattern = re.compile(r"^Beta$", re.MULTILINE)
     result = doc.get(Selector(select_type="code", select_regex=pattern))
@@ -194,16 +209,7 @@ def test_get_respects_regex_multiline_flag():
 
 
 def test_get_respects_regex_dotall_flag():
-    doc = MarkdownDocument.from_string(
-        dedent(
-            """
-            ```
-            Alpha
-            Gamma
-            ```
-            """
-        ).lstrip()
-    )
+    doc = MarkdownDocument.from_string(_CODE_ALPHA_GAMMA_DOC)
 
     pattern = re.compile(r"Alpha.*Gamma", re.DOTALL)
     result = doc.get(Selector(select_type="code", select_regex=pattern))
@@ -211,9 +217,8 @@ def test_get_respects_regex_dotall_flag():
     assert "Alpha" in result and "Gamma" in result
 
 
-def test_get_rejects_unsupported_regex_flags():
-    doc = MarkdownDocument.from_string("Paragraph.\n")
+def test_get_rejects_unsupported_regex_flags(paragraph_doc):
     pattern = re.compile(r"paragraph", re.VERBOSE)
 
     with pytest.raises(InvalidRegexError):
-        doc.get(Selector(select_type="p", select_regex=pattern))
+        paragraph_doc.get(Selector(select_type="p", select_regex=pattern))
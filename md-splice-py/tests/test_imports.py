@@ -33,6 +33,12 @@ def test_operation_serializers_available() -> None:
     assert callable(dumps_operations)
 
 
+def test_types_submodule_accessible() -> None:
+    import md_splice
+
+    assert md_splice.types.Selector is md_splice.Selector
+
+
 def test_error_docstrings_present() -> None:
     assert "md-splice Python bindings" in MdSpliceError.__doc__
     assert "selector fails" in NodeNotFoundError.__doc__
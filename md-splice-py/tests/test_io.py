@@ -89,6 +89,21 @@ def test_write_in_place_can_create_backup(tmp_path: Path) -> None:
     assert "Added later" in updated
 
 
+def test_write_in_place_skips_unchanged_document(tmp_path: Path) -> None:
+    source_path = tmp_path / "doc.md"
+    source_path.write_text("# Heading\n\nParagraph.\n", encoding="utf-8")
+
+    doc = MarkdownDocument.from_file(source_path)
+    assert not doc.is_dirty()
+
+    doc.write_in_place(backup=True)
+
+    # The no-op write leaves the file untouched (including its trailing
+    # newline, which rendering alone would drop) and creates no backup.
+    assert source_path.read_text(encoding="utf-8") == "# Heading\n\nParagraph.\n"
+    assert not source_path.with_name("doc.md~").exists()
+
+
 def test_write_in_place_without_path_raises() -> None:
     doc = MarkdownDocument.from_string("Paragraph.\n")
 
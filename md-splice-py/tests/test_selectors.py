@@ -5,7 +5,11 @@ import re
 import pytest
 
 from md_splice.errors import ConflictingScopeError, InvalidRegexError
-from md_splice.types import Selector
+from md_splice.types import (
+    Selector,
+    SetFrontmatterOperation,
+    _compile_selector_regex,
+)
 
 
 def test_selector_accepts_compiled_regex():
@@ -45,3 +49,58 @@ def test_selector_rejects_within_and_within_ref() -> None:
     scope = Selector(select_type="section")
     with pytest.raises(ValueError, match="within"):
         Selector(within=scope, within_ref="alias")
+
+
+def test_create_compiles_regex_up_front() -> None:
+    selector = Selector.create(select_type="p", select_regex=r"foo?bar")
+    assert isinstance(selector.select_regex, re.Pattern)
+    assert selector.select_regex.pattern == r"foo?bar"
+
+
+def test_create_invalid_regex_raises() -> None:
+    with pytest.raises(InvalidRegexError):
+        Selector.create(select_regex="[")
+
+
+def test_prewarm_seeds_regex_cache() -> None:
+    pattern = r"prewarmed-[0-9]+"
+    Selector.prewarm([pattern])
+    selector = Selector(select_regex=pattern)
+    assert selector.select_regex is _compile_selector_regex(pattern)
+
+
+def test_prewarm_invalid_regex_raises() -> None:
+    with pytest.raises(InvalidRegexError):
+        Selector.prewarm(["["])
+
+
+def test_of_returns_shared_instance_for_equal_kwargs() -> None:
+    first = Selector.of(select_type="li", select_contains="task")
+    second = Selector.of(select_contains="task", select_type="li")
+    assert first is second
+    assert first.select_type == "li"
+
+
+def test_of_distinguishes_string_and_compiled_patterns() -> None:
+    compiled = re.compile(r"task")
+    from_string = Selector.of(select_regex=r"task")
+    from_pattern = Selector.of(select_regex=compiled)
+    assert from_string is not from_pattern
+    assert from_pattern.select_regex is compiled
+
+
+def test_make_skips_validation() -> None:
+    base = Selector(select_type="heading")
+    selector = Selector._make(after=base, within=base)
+    assert selector.after is base
+    assert selector.within is base
+
+
+def test_make_missing_required_field_raises() -> None:
+    with pytest.raises(TypeError, match="missing required field 'key'"):
+        SetFrontmatterOperation._make(value="draft")
+
+
+def test_make_drops_unknown_kwargs() -> None:
+    selector = Selector._make(select_typ="p")
+    assert selector.select_type is None